@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable, Mapping, Sequence
 from typing import Any
 
@@ -8,7 +9,7 @@ from retrocast.adapters.errors import adapter_cycle_error, adapter_node_type_err
 from retrocast.chem import canonicalize_smiles, get_inchi_key
 from retrocast.exceptions import AdapterLogicError, InvalidSmilesError
 from retrocast.models.route import Molecule, Reaction
-from retrocast.typing import SmilesStr
+from retrocast.typing import InChIKeyStr, SmilesStr
 
 ReactionAnnotations = Mapping[SmilesStr, Mapping[str, Any]]
 ReactionFields = Mapping[str, Any]
@@ -46,7 +47,9 @@ def _build_molecule_from_precursor_map(
     reaction_annotations: ReactionAnnotations | None,
 ) -> Molecule | None:
     try:
-        canon_smiles = canonicalize_smiles(smiles)
+        # Building blocks repeat across a batch of routes; interning keeps one string object per distinct SMILES
+        # and per InChIKey.
+        canon_smiles = SmilesStr(sys.intern(canonicalize_smiles(smiles)))
     except InvalidSmilesError:
         if mode == "prune":
             return None
@@ -57,7 +60,7 @@ def _build_molecule_from_precursor_map(
 
     reactant_smiles = precursor_map.get(canon_smiles)
     if reactant_smiles is None:
-        return Molecule(smiles=canon_smiles, inchikey=get_inchi_key(canon_smiles))
+        return Molecule(smiles=canon_smiles, inchikey=InChIKeyStr(sys.intern(get_inchi_key(canon_smiles))))
 
     reactants: list[Molecule] = []
     for reactant in reactant_smiles:
@@ -84,7 +87,7 @@ def _build_molecule_from_precursor_map(
     annotations = dict(reaction_annotations.get(canon_smiles, {})) if reaction_annotations is not None else {}
     return Molecule(
         smiles=canon_smiles,
-        inchikey=get_inchi_key(canon_smiles),
+        inchikey=InChIKeyStr(sys.intern(get_inchi_key(canon_smiles))),
         product_of=Reaction(reactants=reactants, annotations=annotations),
     )
 
@@ -84,6 +84,13 @@ class DirectMultiStepAdapter:
 
     @staticmethod
     def calculate_route_length(dms_node: DMSTree) -> int:
-        if not dms_node.children:
-            return 0
-        return max(DirectMultiStepAdapter.calculate_route_length(child) for child in dms_node.children) + 1
+        # Explicit stack: long linear routes do not hit the recursion limit.
+        max_length = 0
+        stack = [(dms_node, 0)]
+        while stack:
+            node, length = stack.pop()
+            if node.children:
+                stack.extend((child, length + 1) for child in node.children)
+            else:
+                max_length = max(max_length, length)
+        return max_length
@@ -8,6 +8,7 @@ from typing import Any
 
 import yaml
 
+from retrocast.cli.config import load_yaml
 from retrocast.exceptions import ConfigurationError, InputError
 from retrocast.io import load_analysis_report
 from retrocast.models.analysis import MetricSummary
@@ -44,25 +45,7 @@ def handle_pareto_frontier(args: argparse.Namespace) -> Path:
         raise InputError("no analysis reports with the requested metric were loaded", code="input.empty_comparison")
 
     fig = go.Figure()
-    for point in points:
-        fig.add_trace(
-            go.Scatter(
-                x=[point.x_value],
-                y=[point.metric.value],
-                mode="markers+text",
-                name=point.label,
-                text=[point.short_label],
-                textposition="top center",
-                marker={"color": point.color, "size": 11},
-                customdata=[[point.model_name, point.metric.count, point.metric.ci_low, point.metric.ci_high]],
-                hovertemplate=(
-                    "<b>%{fullData.name}</b><br>"
-                    f"{_x_axis_title(time_based)}: %{{x}}<br>"
-                    f"{metric_name}: %{{y:.3f}}<br>"
-                    "n: %{customdata[1]}<extra></extra>"
-                ),
-            )
-        )
+    fig.add_traces(_point_traces(points, metric_name=metric_name, time_based=time_based))
 
     _add_group_lines(fig, points, config)
     fig.update_layout(
@@ -85,7 +68,7 @@ def handle_pareto_frontier(args: argparse.Namespace) -> Path:
 def _load_config(path: Path) -> dict[str, Any]:
     try:
         with open(path, encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle) or {}
+            payload = load_yaml(handle) or {}
     except yaml.YAMLError as exc:
         raise ConfigurationError(
             f"failed to parse compare config {path}",
@@ -236,6 +219,36 @@ def _x_axis_title(time_based: bool) -> str:
     return "wall time seconds" if time_based else "hourly cost"
 
 
+def _point_traces(points: list[ParetoPoint], *, metric_name: str, time_based: bool) -> list[dict[str, Any]]:
+    # One marker trace per legend entry rather than per point; points sharing a label and colour share a trace.
+    grouped: dict[tuple[str, str], list[ParetoPoint]] = {}
+    for point in points:
+        grouped.setdefault((point.label, point.color), []).append(point)
+    return [
+        {
+            "type": "scatter",
+            "x": [point.x_value for point in group_points],
+            "y": [point.metric.value for point in group_points],
+            "mode": "markers+text",
+            "name": label,
+            "text": [point.short_label for point in group_points],
+            "textposition": "top center",
+            "marker": {"color": color, "size": 11},
+            "customdata": [
+                [point.model_name, point.metric.count, point.metric.ci_low, point.metric.ci_high]
+                for point in group_points
+            ],
+            "hovertemplate": (
+                "<b>%{fullData.name}</b><br>"
+                f"{_x_axis_title(time_based)}: %{{x}}<br>"
+                f"{metric_name}: %{{y:.3f}}<br>"
+                "n: %{customdata[1]}<extra></extra>"
+            ),
+        }
+        for (label, color), group_points in grouped.items()
+    ]
+
+
 def _add_group_lines(fig: Any, points: list[ParetoPoint], config: dict[str, Any]) -> None:
     group_colors = {
         str(group["id"]): str(group["color"])
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics as yaml.safe_load.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: IO[str]) -> Any:
+    """Parse a YAML config stream with the fastest available safe loader."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
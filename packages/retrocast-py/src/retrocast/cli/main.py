@@ -4,9 +4,11 @@ import argparse
 import gzip
 import json
 import logging
+import os
 import re
 from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
@@ -21,6 +23,7 @@ from retrocast.adapters.base import AdaptMode
 from retrocast.adapters.registry import DEPRECATED_ADAPTER_SLUGS, normalize_adapter_slug
 from retrocast.chem import get_inchi_key
 from retrocast.cli.compare import handle_pareto_frontier
+from retrocast.cli.config import load_yaml
 from retrocast.cli.manifest import manifest_sidecar_path, write_manifest
 from retrocast.cli.progress import create_cli_progress, estimate_raw_route_entries, quiet_info_logs
 from retrocast.cli.report import create_analysis_table, generate_markdown_report
@@ -49,7 +52,12 @@ from retrocast.io import (
     save_evaluation,
 )
 from retrocast.io.data import load_stock_file
-from retrocast.metrics.constraints import RequiredLeavesChecker, RouteDepthChecker, StockTerminationChecker
+from retrocast.metrics.constraints import (
+    RequiredLeavesChecker,
+    RouteDepthChecker,
+    StockTerminationChecker,
+    TaskConstraintChecker,
+)
 from retrocast.models.analysis import AnalysisReport
 from retrocast.models.evaluation import AcceptableRouteMatch, Evaluation
 from retrocast.models.provenance import VerificationReport
@@ -72,12 +80,14 @@ from retrocast.typing import InChIKeyStr
 from retrocast.utils.logging import configure_script_logging
 from retrocast.utils.timing import ExecutionStats
 from retrocast.workflow import (
+    acceptable_route_identities,
     adapt_candidates,
     analyze,
     collect_candidates,
     ingest_candidates,
     score,
 )
+from retrocast.workflow.score import AcceptableRouteIdentity
 from retrocast.workflow.stats import candidate_statistics, collected_candidate_statistics, evaluation_statistics
 from retrocast.workflow.verify import verify_manifest
 
@@ -212,6 +222,7 @@ def _build_parser() -> argparse.ArgumentParser:
     score_file.add_argument("--stock-name", help="Stock label to write into task constraints")
     score_file.add_argument("--model-name", help="Optional model label for manifest metadata")
     score_file.add_argument("--ignore-stereo", action="store_true", help="Use stereo-agnostic stock matching")
+    _add_workers_arg(score_file)
     _add_acceptable_route_match_arg(score_file)
 
     compare_parser = subparsers.add_parser("compare", help="Compare schema v2 analysis reports")
@@ -229,11 +240,13 @@ def _build_parser() -> argparse.ArgumentParser:
         "--max-candidates", type=_non_negative_int, help="Ingest only the first N raw candidate slots per target"
     )
     ingest.add_argument("--no-progress", action="store_true", help="Disable progress bars during ingestion")
+    _add_workers_arg(ingest)
 
     score_parser = subparsers.add_parser("score", help="Score v2 processed candidates")
     _add_model_dataset_args(score_parser)
     score_parser.add_argument("--ignore-stereo", action="store_true", help="Use stereo-agnostic stock matching")
     _add_acceptable_route_match_arg(score_parser)
+    _add_workers_arg(score_parser)
 
     analyze_parser = subparsers.add_parser("analyze", help="Analyze v2 evaluation artifacts")
     _add_model_dataset_args(analyze_parser)
@@ -248,6 +261,12 @@ def _build_parser() -> argparse.ArgumentParser:
     verify_target.add_argument("--all", action="store_true", help="Verify every manifest under the data directory")
     verify_parser.add_argument("--deep", action="store_true", help="Follow generated-artifact manifest links")
     verify_parser.add_argument("--strict", action="store_true", help="Treat missing files as failures")
+    verify_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Threads used to read manifests and hash files (default: serially)",
+    )
 
     return parser
 
@@ -259,6 +278,22 @@ def _non_negative_int(value: str) -> int:
     return parsed
 
 
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError("must be positive")
+    return parsed
+
+
+def _add_workers_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Process pool size for per-target work (default: run serially)",
+    )
+
+
 def _add_acceptable_route_match_arg(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--acceptable-route-match",
@@ -345,7 +380,7 @@ def _load_config(config_path: Path) -> dict[str, Any]:
         return {}
     try:
         with open(config_path, encoding="utf-8") as handle:
-            return yaml.safe_load(handle) or {}
+            return load_yaml(handle) or {}
     except yaml.YAMLError as exc:
         raise ConfigurationError(
             f"Failed to parse config file {config_path}",
@@ -410,6 +445,7 @@ def handle_score_file(args: argparse.Namespace) -> None:
         ],
         acceptable_match_level=match_level,
         acceptable_route_match=AcceptableRouteMatch(args.acceptable_route_match),
+        max_workers=args.workers,
     )
     save_evaluation(evaluation, args.output)
     write_manifest(
@@ -471,7 +507,10 @@ def _load_stock_path(path: Path) -> set[InChIKeyStr]:
 
 
 def _stock_inchikeys_from_lines(lines: Iterable[str]) -> set[InChIKeyStr]:
-    return {InChIKeyStr(get_inchi_key(line.strip())) for line in lines if line.strip()}
+    # Strip each line once and drop repeated SMILES before the RDKit InChIKey call; file order is kept for errors.
+    smiles = dict.fromkeys(map(str.strip, lines))
+    smiles.pop("", None)
+    return {InChIKeyStr(get_inchi_key(value)) for value in smiles}
 
 
 def handle_ingest(args: argparse.Namespace, config: dict[str, Any]) -> None:
@@ -507,11 +546,12 @@ def _ingest_one(
     if not raw_dir.exists():
         logger.warning("Skipping %s/%s: raw directory missing", model_name, benchmark_name)
         return
-    adapter_name = args.adapter or _manifest_directive(raw_dir / "manifest.json", "adapter")
+    directives = _manifest_directives(raw_dir / "manifest.json")
+    adapter_name = args.adapter or _directive(directives, "adapter")
     if adapter_name is None:
         logger.warning("Skipping %s/%s: no adapter in CLI or manifest", model_name, benchmark_name)
         return
-    raw_filename = _manifest_directive(raw_dir / "manifest.json", "raw_results_filename") or "results.json.gz"
+    raw_filename = _directive(directives, "raw_results_filename") or "results.json.gz"
     raw_path = raw_dir / raw_filename
     if not raw_path.exists():
         logger.warning("Skipping %s/%s: raw file missing at %s", model_name, benchmark_name, raw_path)
@@ -542,6 +582,7 @@ def _ingest_one(
             mode=args.mode,
             max_candidates=args.max_candidates,
             progress_callback=advance_progress,
+            max_workers=args.workers,
         )
 
     output_path = output_dir / "candidates.json.gz"
@@ -568,40 +609,75 @@ def _ingest_one(
 
 def handle_score(args: argparse.Namespace, config: dict[str, Any]) -> None:
     paths = get_paths(Path(config.get("data_dir", DEFAULT_DATA_DIR)))
-    for model_name in _resolve_models(args, paths, stage="score"):
-        for benchmark_name in _resolve_benchmarks(args, paths):
-            _score_one(model_name, benchmark_name, paths, args)
+    model_names = _resolve_models(args, paths, stage="score")
+    for benchmark_name in _resolve_benchmarks(args, paths):
+        # Task, stock and acceptable-route signatures are shared by every model on one benchmark.
+        context: _ScoringContext | None = None
+        for model_name in model_names:
+            context = _score_one(model_name, benchmark_name, paths, args, context)
 
 
-def _score_one(model_name: str, benchmark_name: str, paths: dict[str, Path], args: argparse.Namespace) -> None:
-    task_path = paths["benchmarks"] / f"{benchmark_name}.json.gz"
-    candidates_path = paths["processed"] / benchmark_name / model_name / "candidates.json.gz"
-    if not candidates_path.exists():
-        logger.warning("Skipping %s/%s: no processed candidates", model_name, benchmark_name)
-        return
+@dataclass(frozen=True)
+class _ScoringContext:
+    task_path: Path
+    task: Benchmark
+    constraint_checkers: list[TaskConstraintChecker]
+    stock_paths: list[Path]
+    output_label: str
+    acceptable_identities: dict[str, tuple[AcceptableRouteIdentity, ...]]
 
-    predictions = load_collected_candidates(candidates_path)
+
+def _scoring_context(benchmark_name: str, paths: dict[str, Path], match_level: InChIKeyLevel) -> _ScoringContext:
+    task_path = paths["benchmarks"] / f"{benchmark_name}.json.gz"
     task = load_benchmark(task_path)
     stock_registry, stock_paths, output_label = _load_stock_registry(task, paths)
-    match_level = InChIKeyLevel.NO_STEREO if args.ignore_stereo else InChIKeyLevel.FULL
-    evaluation = score(
-        predictions=predictions,
+    return _ScoringContext(
+        task_path=task_path,
         task=task,
         constraint_checkers=[
             StockTerminationChecker(stocks=stock_registry, match_level=match_level),
             RequiredLeavesChecker(match_level=match_level),
             RouteDepthChecker(),
         ],
+        stock_paths=stock_paths,
+        output_label=output_label,
+        acceptable_identities=acceptable_route_identities(task, match_level),
+    )
+
+
+def _score_one(
+    model_name: str,
+    benchmark_name: str,
+    paths: dict[str, Path],
+    args: argparse.Namespace,
+    context: _ScoringContext | None = None,
+) -> _ScoringContext | None:
+    candidates_path = paths["processed"] / benchmark_name / model_name / "candidates.json.gz"
+    if not candidates_path.exists():
+        logger.warning("Skipping %s/%s: no processed candidates", model_name, benchmark_name)
+        return context
+
+    predictions = load_collected_candidates(candidates_path)
+    match_level = InChIKeyLevel.NO_STEREO if args.ignore_stereo else InChIKeyLevel.FULL
+    if context is None:
+        context = _scoring_context(benchmark_name, paths, match_level)
+    task_path, output_label = context.task_path, context.output_label
+    evaluation = score(
+        predictions=predictions,
+        task=context.task,
+        constraint_checkers=context.constraint_checkers,
         acceptable_match_level=match_level,
         acceptable_route_match=AcceptableRouteMatch(args.acceptable_route_match),
         execution_stats=_load_execution_stats_if_present(_execution_stats_path(paths, model_name, benchmark_name)),
+        max_workers=args.workers,
+        acceptable_identities=context.acceptable_identities,
     )
 
     output_dir = paths["scored"] / benchmark_name / model_name / output_label
     output_path = output_dir / "evaluation.json.gz"
     save_evaluation(evaluation, output_path)
     execution_stats_path = _execution_stats_path(paths, model_name, benchmark_name)
-    sources = [task_path, candidates_path, *stock_paths]
+    sources = [task_path, candidates_path, *context.stock_paths]
     if execution_stats_path.exists():
         sources.append(execution_stats_path)
     write_manifest(
@@ -620,6 +696,7 @@ def _score_one(model_name: str, benchmark_name: str, paths: dict[str, Path], arg
         statistics=evaluation_statistics(evaluation),
     )
     logger.info("Scored %s/%s using %s to %s", model_name, benchmark_name, output_label, output_path)
+    return context
 
 
 def handle_analyze(args: argparse.Namespace, config: dict[str, Any]) -> None:
@@ -770,8 +847,9 @@ def handle_list(config: dict[str, Any]) -> None:
         try:
             model_name = validate_directory_name(model_name, param_name="model")
             benchmark_name = validate_directory_name(benchmark_name, param_name="benchmark")
-            adapter_name = _manifest_directive(manifest_path, "adapter")
-            raw_filename = _manifest_directive(manifest_path, "raw_results_filename") or "results.json.gz"
+            directives = _manifest_directives(manifest_path)
+            adapter_name = _directive(directives, "adapter")
+            raw_filename = _directive(directives, "raw_results_filename") or "results.json.gz"
             rows.append((model_name, benchmark_name, adapter_name or "", raw_filename))
         except (OSError, json.JSONDecodeError, SecurityError) as exc:
             logger.debug("Skipping malformed raw manifest %s: %s", manifest_path, exc)
@@ -804,6 +882,8 @@ def handle_verify(args: argparse.Namespace, config: dict[str, Any]) -> None:
     manifest_paths = _resolve_manifest_paths(args, data_dir)
 
     reports = []
+    # Manifests share sources and outputs; hash each file once for the whole run.
+    hash_cache: dict[Path, str] = {}
     with create_cli_progress(console=console, unit="manifests") as progress:
         task_id = progress.add_task("Verifying manifests", total=len(manifest_paths))
         with quiet_info_logs("retrocast"):
@@ -814,6 +894,10 @@ def handle_verify(args: argparse.Namespace, config: dict[str, Any]) -> None:
                         root_dir=data_dir,
                         deep=args.deep,
                         lenient=not args.strict,
+                        max_workers=args.workers,
+                        hash_cache=hash_cache,
+                        # Batch summaries only show failures and warnings.
+                        include_info=len(manifest_paths) == 1,
                     )
                 )
                 progress.advance(task_id)
@@ -830,7 +914,12 @@ def handle_verify(args: argparse.Namespace, config: dict[str, Any]) -> None:
 
 def _resolve_manifest_paths(args: argparse.Namespace, data_dir: Path) -> list[Path]:
     if args.all:
-        manifest_paths = sorted(data_dir.glob("**/manifest.json"))
+        # os.walk lists each directory once without building a Path per entry, unlike a recursive glob.
+        manifest_paths = sorted(
+            Path(dirpath) / "manifest.json"
+            for dirpath, _, filenames in os.walk(data_dir)
+            if "manifest.json" in filenames
+        )
         if not manifest_paths:
             logger.warning("No manifests found under %s", data_dir)
         return manifest_paths
@@ -942,27 +1031,32 @@ def _resolve_benchmarks(args: argparse.Namespace, paths: dict[str, Path]) -> lis
     )
 
 
-def _manifest_directive(path: Path, key: str) -> str | None:
+def _manifest_directives(path: Path) -> dict[str, Any]:
+    # Parsed once per manifest; callers read every directive they need from the returned mapping.
     if not path.exists():
-        return None
+        return {}
     try:
-        with open(path, encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = json.loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise ConfigurationError(
             f"invalid manifest JSON: {path}",
             code="cli.invalid_manifest",
-            context={"path": str(path), "directive": key},
+            context={"path": str(path)},
         ) from exc
     except OSError as exc:
         raise ConfigurationError(
             f"could not read manifest: {path}",
             code="cli.manifest_read_failed",
-            context={"path": str(path), "directive": key},
+            context={"path": str(path)},
         ) from exc
     if not isinstance(payload, dict):
-        return None
-    value = payload.get("directives", {}).get(key)
+        return {}
+    directives = payload.get("directives", {})
+    return directives if isinstance(directives, dict) else {}
+
+
+def _directive(directives: dict[str, Any], key: str) -> str | None:
+    value = directives.get(key)
     return str(value) if value is not None else None
 
 
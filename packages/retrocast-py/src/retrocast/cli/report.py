@@ -20,6 +20,7 @@ _ROOT_TOP_K = re.compile(r"^acceptable_root_reconstruction_top_(\d+)\[(.+)]$")
 _GIVEN_ROOT_TOP_K = re.compile(r"^acceptable_reconstruction_given_root_top_(\d+)\[(.+)]$")
 _PREFIX_TOP_K = re.compile(r"^acceptable_prefix_reconstruction_depth_(\d+)_top_(\d+)\[(.+)]$")
 _DISTINCT_ROOT_TOP_K = re.compile(r"^distinct_root_reactions_top_(\d+)\[(.+)]$")
+_RELIABILITY_SYMBOLS = {"OK": "", "LOW_N": "!", "EXTREME_P": "*"}
 
 
 def create_analysis_table(
@@ -172,7 +173,7 @@ def generate_markdown_report(report: AnalysisReport, *, title: str = "Evaluation
         note_parts.append(legend)
     if note_parts:
         lines.extend([" | ".join(note_parts), ""])
-    lines.extend(_markdown_headline_metric_table(report.metrics))
+    lines.append(_markdown_headline_metric_table(report.metrics))
     lines.extend(_markdown_reconstruction_diagnostics(report.metrics))
     runtime_rows = _runtime_rows(report, rich=False)
     if runtime_rows:
@@ -191,10 +192,15 @@ def generate_markdown_report(report: AnalysisReport, *, title: str = "Evaluation
     if report.by_stratum:
         lines.extend(["", "## By Stratum", ""])
         for stratum in sorted(report.by_stratum):
-            lines.extend([f"### {stratum}", ""])
-            lines.extend(_markdown_headline_metric_table(report.by_stratum[stratum]))
-            lines.extend(_markdown_reconstruction_diagnostics(report.by_stratum[stratum], heading_level=4))
-            lines.append("")
+            lines.extend(
+                [
+                    f"### {stratum}",
+                    "",
+                    _markdown_headline_metric_table(report.by_stratum[stratum]),
+                    *_markdown_reconstruction_diagnostics(report.by_stratum[stratum], heading_level=4),
+                    "",
+                ]
+            )
     return "\n".join(lines).rstrip() + "\n"
 
 
@@ -211,23 +217,22 @@ def _report_note_parts(report: AnalysisReport, *, ci_separator: str = "=") -> li
     return parts
 
 
-def _markdown_headline_metric_table(metrics: dict[str, MetricSummary]) -> list[str]:
-    rows: list[MarkdownRow] = []
-    for name, metric, match in _headline_metrics(metrics):
-        rows.append(
-            (
-                _display_metric_name(name, match),
-                _format_value(name, metric),
-                _format_ci(name, metric, rich=False),
-                metric.count,
-                _format_reliability(metric, rich=False),
-            )
+def _markdown_headline_metric_table(metrics: dict[str, MetricSummary]) -> str:
+    rows: list[MarkdownRow] = [
+        (
+            _display_metric_name(name, match),
+            _format_value(name, metric),
+            _format_ci(name, metric, rich=False),
+            metric.count,
+            _format_reliability(metric, rich=False),
         )
+        for name, metric, match in _headline_metrics(metrics)
+    ]
     return markdown_table(
         ["Metric", "Value", "95% CI", "N", "Flags"],
         rows,
         align=["left", "right", "center", "right", "center"],
-    ).splitlines()
+    )
 
 
 def _markdown_reconstruction_diagnostics(
@@ -269,12 +274,12 @@ def _markdown_reconstruction_diagnostics(
     diagnostic_align: list[MarkdownAlign] = ["left"]
     for _ in diagnostics:
         diagnostic_align.append("right")
-    lines.extend(
+    lines.append(
         markdown_table(
             ["K", *[label for label, _ in diagnostics]],
             top_k_rows,
             align=diagnostic_align,
-        ).splitlines()
+        )
     )
 
     depths = _diagnostic_prefix_depths(metrics)
@@ -285,13 +290,17 @@ def _markdown_reconstruction_diagnostics(
         prefix_align: list[MarkdownAlign] = ["left"]
         for _ in depths:
             prefix_align.append("right")
-        lines.extend(["", f"{heading} Prefix Reconstruction", ""])
         lines.extend(
-            markdown_table(
-                ["K", *[f"Depth {depth}" for depth in depths]],
-                prefix_rows,
-                align=prefix_align,
-            ).splitlines()
+            [
+                "",
+                f"{heading} Prefix Reconstruction",
+                "",
+                markdown_table(
+                    ["K", *[f"Depth {depth}" for depth in depths]],
+                    prefix_rows,
+                    align=prefix_align,
+                ),
+            ]
         )
 
     return lines
@@ -423,12 +432,8 @@ def _format_reliability(metric: MetricSummary, *, rich: bool = True) -> str:
 
 
 def _format_reliability_symbol(metric: MetricSummary) -> str:
-    reliability = metric.reliability
-    if reliability is None or reliability.code == "OK":
-        return ""
-    if reliability.code == "EXTREME_P":
-        return "[yellow]*[/]"
-    return "[yellow]![/]"
+    symbol = _plain_reliability_symbol(metric)
+    return f"[yellow]{symbol}[/]" if symbol else ""
 
 
 def _reliability_legend(metrics: list[MetricSummary]) -> str | None:
@@ -451,11 +456,9 @@ def _reliability_legend_parts(metrics: list[MetricSummary]) -> list[tuple[str, s
 
 def _plain_reliability_symbol(metric: MetricSummary) -> str:
     reliability = metric.reliability
-    if reliability is None or reliability.code == "OK":
+    if reliability is None:
         return ""
-    if reliability.code == "EXTREME_P":
-        return "*"
-    return "!"
+    return _RELIABILITY_SYMBOLS.get(reliability.code, "!")
 
 
 def _headline_metrics(metrics: dict[str, MetricSummary]) -> list[tuple[str, MetricSummary, re.Match[str]]]:
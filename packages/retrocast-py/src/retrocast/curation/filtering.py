@@ -9,7 +9,7 @@ and keeps curation pools from leaking duplicate or ambiguous targets.
 from __future__ import annotations
 
 from collections.abc import Callable, Hashable
-from typing import Literal
+from typing import Any, Literal
 
 from retrocast.models.route import Molecule, Route, RoutePath
 from retrocast.models.task import Benchmark, Target
@@ -83,7 +83,11 @@ def deduplicate_routes(
     ``key`` to deduplicate by a broader or narrower identity, such as depth,
     target key, or a depth-limited signature.
     """
-    route_key = key or (lambda route: route.signature())
+    if len(routes) < 2:
+        return list(routes)
+    # Routes in one batch share most subtrees, so the default key hashes each distinct subtree once.
+    signature_cache: dict[tuple[Any, ...], str] = {}
+    route_key = key or (lambda route: route.signature(signature_cache=signature_cache))
     seen = set()
     output = []
     for route in routes:
@@ -206,13 +206,15 @@ def build_container_embedding_index(
         record_reaction_signatures = set(record.route.reaction_signatures(match_level))
         reaction_signatures.update(record_reaction_signatures)
         reaction_signature_route_counts.update(record_reaction_signatures)
-        for depth in range(1, record.route.depth() + 1):
+        molecules = list(record.route.iter_molecules())
+        subtree_depths = _subtree_depths(molecules)
+        for depth in range(1, subtree_depths[id(record.route.target)] + 1):
             root_prefix_signature = record.route.signature(match_level, depth=depth)
             root_prefix_signatures_by_depth[depth].add(root_prefix_signature)
             root_prefix_signature_counts_by_depth[depth][root_prefix_signature] += 1
         subtree_prefixes_by_depth: dict[int, set[str]] = defaultdict(set)
-        for molecule in record.route.iter_molecules():
-            for depth in range(1, molecule.depth() + 1):
+        for molecule in molecules:
+            for depth in range(1, subtree_depths[id(molecule.value)] + 1):
                 subtree_prefix = molecule.subtree_signature(match_level, depth=depth)
                 subtree_prefix_signatures_by_depth[depth].add(subtree_prefix)
                 subtree_prefixes_by_depth[depth].add(subtree_prefix)
@@ -327,10 +329,11 @@ def _summarize_prefix_depths(
     match_level: InChIKeyLevel,
     exclude_query_containers: bool,
 ) -> tuple[PrefixDepthSummary, ...]:
-    max_depth = max((route.depth() for route in queries.values()), default=0)
+    query_depths = [(route, route.depth()) for route in queries.values()]
+    max_depth = max((route_depth for _, route_depth in query_depths), default=0)
     summaries: list[PrefixDepthSummary] = []
     for depth in range(1, max_depth + 1):
-        eligible = [route for route in queries.values() if route.depth() >= depth]
+        eligible = [route for route, route_depth in query_depths if route_depth >= depth]
         root_prefixes = index.root_prefix_signatures_by_depth.get(depth, set())
         subtree_prefixes = index.subtree_prefix_signatures_by_depth.get(depth, set())
         root_counts = index.root_prefix_signature_counts_by_depth.get(depth, {})
@@ -353,6 +356,17 @@ def _summarize_prefix_depths(
     return tuple(summaries)
 
 
+def _subtree_depths(molecules: Sequence[MoleculeView]) -> dict[int, int]:
+    # Pre-order reversed visits every reactant before its product, so each subtree depth is derived once.
+    depths: dict[int, int] = {}
+    for molecule in reversed(molecules):
+        reaction = molecule.value.product_of
+        depths[id(molecule.value)] = (
+            0 if reaction is None else 1 + max((depths[id(reactant)] for reactant in reaction.reactants), default=0)
+        )
+    return depths
+
+
 def _full_route_ledger_rows(
     *,
     source: str,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import warnings
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
@@ -12,6 +12,7 @@ from retrocast.curation.training.records import (
     TrainingReactionSource,
     TrainingRouteRecord,
     TrainingSetBuildConfig,
+    group_records_by_split,
 )
 from retrocast.exceptions import TrainingReleaseError
 from retrocast.hashing import hash_json
@@ -32,8 +33,9 @@ class TrainingReactionReleaseBuilder:
             raise RuntimeError("TrainingReactionReleaseBuilder instances are single-use")
         self._started = True
 
-        training, training_postprocessing = self._build_split("training")
-        validation_before, validation_postprocessing = self._build_split("validation")
+        route_records_by_split = group_records_by_split(self.route_records)
+        training, training_postprocessing = self._build_split(route_records_by_split["training"])
+        validation_before, validation_postprocessing = self._build_split(route_records_by_split["validation"])
         overlap_before = _summarize_cross_split_overlap(training, validation_before)
         if self.config.holdout_mode == "reaction":
             training_keys = {_reaction_identity(record) for record in training}
@@ -75,23 +77,23 @@ class TrainingReactionReleaseBuilder:
             },
         )
 
-    def _build_split(self, split: str) -> tuple[list[TrainingReactionRecord], dict[str, int]]:
-        flattened = self._flatten(split)
+    def _build_split(
+        self, route_records: Sequence[TrainingRouteRecord]
+    ) -> tuple[list[TrainingReactionRecord], dict[str, int]]:
+        flattened = self._flatten(route_records)
         exact_unique, exact_duplicates_removed = _merge_exact_reaction_duplicates(flattened)
         transform_unique, mapped_variants_collapsed = _merge_transform_equivalent_reactions(exact_unique)
         return transform_unique, {
-            "input_routes": sum(1 for record in self.route_records if record.split == split),
+            "input_routes": len(route_records),
             "flattened_reactions": len(flattened),
             "chemical_duplicates_removed": exact_duplicates_removed,
             "mapped_smiles_variants_collapsed": mapped_variants_collapsed,
             "duplicate_reactions_removed": exact_duplicates_removed + mapped_variants_collapsed,
         }
 
-    def _flatten(self, split: str) -> list[TrainingReactionRecord]:
+    def _flatten(self, route_records: Sequence[TrainingRouteRecord]) -> list[TrainingReactionRecord]:
         records = []
-        for route_record in self.route_records:
-            if route_record.split != split:
-                continue
+        for route_record in route_records:
             for step_index, reaction in enumerate(route_record.route.iter_reactions(), start=1):
                 mapped_smiles = reaction.value.mapped_reaction_smiles
                 if mapped_smiles is None:
@@ -152,8 +154,9 @@ def write_training_reaction_release(
     training_rsmi_path = release_dir / "training.rsmi.txt.gz"
     validation_rsmi_path = release_dir / "validation.rsmi.txt.gz"
     manifest_path = release_dir / "manifest.json"
-    training = [record for record in result.records if record.split == "training"]
-    validation = [record for record in result.records if record.split == "validation"]
+    records_by_split = group_records_by_split(result.records)
+    training = records_by_split["training"]
+    validation = records_by_split["validation"]
     save_jsonl_gz(result.records, all_path)
     save_jsonl_gz(training, training_path)
     save_jsonl_gz(validation, validation_path)
@@ -179,9 +182,8 @@ def write_training_reaction_release(
 
 
 def summarize_reaction_records(records: Sequence[TrainingReactionRecord]) -> dict[str, Any]:
-    training = sum(1 for record in records if record.split == "training")
-    validation = sum(1 for record in records if record.split == "validation")
-    return {"all_records": {"total": len(records), "training": training, "validation": validation}}
+    splits = Counter(record.split for record in records)
+    return {"all_records": {"total": len(records), "training": splits["training"], "validation": splits["validation"]}}
 
 
 def reaction_records_content_hash(records: Sequence[TrainingReactionRecord]) -> str:
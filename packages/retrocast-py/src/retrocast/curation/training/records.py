@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -108,7 +109,7 @@ class TrainingSetBuildConfig:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdaptedTrainingRoute:
     route: Route
     source: RawRouteSource
@@ -120,7 +121,7 @@ class TrainingRouteAdaptation:
     stats: AdaptationStatistics
 
 
-@dataclass
+@dataclass(slots=True)
 class PreparedTrainingRoute:
     route: Route
     structural_signature: str
@@ -162,3 +163,14 @@ class AdaptationStatistics(BaseModel):
         if self.non_fatal_condition_slot_parse is not None:
             payload["non_fatal_condition_slot_parse"] = self.non_fatal_condition_slot_parse.model_dump(mode="json")
         return payload
+
+
+SplitRecordT = TypeVar("SplitRecordT", TrainingRouteRecord, TrainingReactionRecord)
+
+
+def group_records_by_split(records: Iterable[SplitRecordT]) -> dict[SplitName, list[SplitRecordT]]:
+    # One pass over the records instead of one filtering pass per split; order within a split is preserved.
+    grouped: dict[SplitName, list[SplitRecordT]] = {"training": [], "validation": []}
+    for record in records:
+        grouped[record.split].append(record)
+    return grouped
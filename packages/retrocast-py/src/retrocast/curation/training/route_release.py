@@ -24,6 +24,7 @@ from retrocast.curation.training.records import (
     TrainingRouteRecord,
     TrainingSetBuildConfig,
     TrainingSetBuildResult,
+    group_records_by_split,
 )
 from retrocast.exceptions import AdapterError, ChemError, TrainingReleaseError
 from retrocast.hashing import hash_file, hash_json
@@ -264,8 +265,9 @@ def write_training_release(
     training_path = release_dir / "training.jsonl.gz"
     validation_path = release_dir / "validation.jsonl.gz"
     manifest_path = release_dir / "manifest.json"
-    training = [record for record in result.records if record.split == "training"]
-    validation = [record for record in result.records if record.split == "validation"]
+    records_by_split = group_records_by_split(result.records)
+    training = records_by_split["training"]
+    validation = records_by_split["validation"]
     save_jsonl_gz(result.records, all_path)
     save_jsonl_gz(training, training_path)
     save_jsonl_gz(validation, validation_path)
@@ -288,11 +290,10 @@ def write_training_release(
 
 
 def summarize_records(records: Sequence[TrainingRouteRecord]) -> dict[str, Any]:
-    training = sum(1 for record in records if record.split == "training")
-    validation = sum(1 for record in records if record.split == "validation")
+    splits = Counter(record.split for record in records)
     depths = Counter(record.route.depth() for record in records)
     return {
-        "all_records": {"total": len(records), "training": training, "validation": validation},
+        "all_records": {"total": len(records), "training": splits["training"], "validation": splits["validation"]},
         "by_depth": {str(depth): depths[depth] for depth in sorted(depths)},
     }
 
@@ -482,7 +483,7 @@ def _annotate_route_molecule(
 def _validation_indices(routes: Sequence[PreparedTrainingRoute], *, val_fraction: float, seed: int) -> set[int]:
     grouped: dict[tuple[int, bool], list[int]] = defaultdict(list)
     for index, route in enumerate(routes):
-        grouped[(route.route.depth(), route.route.is_convergent())].append(index)
+        grouped[route.route.topology()].append(index)
 
     rng = random.Random(seed)
     validation = set()
@@ -2,18 +2,44 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
 from pathlib import Path
 from typing import Any
 
+HASH_CHUNK_SIZE = 1024 * 1024
+MMAP_MIN_SIZE = 128 * 1024
+
+# json.dumps builds a fresh encoder whenever options are passed; route signatures hash one small key per node.
+_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
 
 def hash_file(path: Path) -> str:
     sha256 = hashlib.sha256()
-    with path.open("rb") as handle:
-        while chunk := handle.read(1024 * 1024):
-            sha256.update(chunk)
+    with path.open("rb", buffering=0) as handle:
+        if os.fstat(handle.fileno()).st_size >= MMAP_MIN_SIZE and _update_from_mmap(sha256, handle.fileno()):
+            return sha256.hexdigest()
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        # Unbuffered reads into one reused buffer: no BufferedReader copy and no fresh bytes per chunk.
+        while size := handle.readinto(buffer):
+            sha256.update(view[:size])
     return sha256.hexdigest()
 
 
+def _update_from_mmap(sha256: Any, fileno: int) -> bool:
+    # Large files are hashed straight from the page cache; False means fall back to reading.
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+    with mapped:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        sha256.update(mapped)
+    return True
+
+
 def hash_json(value: Any) -> str:
-    payload = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    payload = _JSON_ENCODER.encode(value)
     return hashlib.sha256(payload.encode()).hexdigest()
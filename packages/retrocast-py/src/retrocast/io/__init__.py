@@ -9,6 +9,7 @@ from retrocast.io.blob import (
     load_lines_gz,
     save_csv_gz,
     save_json_gz,
+    save_json_object_gz,
     save_jsonl_gz,
     save_lines_gz,
 )
@@ -58,6 +59,7 @@ __all__ = [
     "load_task",
     "load_training_route_records",
     "save_json_gz",
+    "save_json_object_gz",
     "save_jsonl_gz",
     "save_lines_gz",
     "save_analysis_report",
@@ -69,6 +69,35 @@ def save_json_gz(data: Any, path: Path) -> None:
         ) from e
 
 
+def save_json_object_gz(items: Iterable[tuple[str, Any]], path: Path) -> int:
+    """
+    Streams key/value pairs to a gzipped JSON object, one member at a time.
+    The bytes match save_json_gz(dict(items), path) without holding the whole document.
+    """
+    path = Path(path)
+
+    n_items = 0
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as raw_f, gzip.GzipFile(filename="", mode="wb", fileobj=raw_f, mtime=0) as gz_f:
+            for key, value in items:
+                if not isinstance(key, str):
+                    raise TypeError(f"JSON object keys must be str, not {type(key).__name__}")
+                # Encoded strings never contain a raw newline, so re-indenting by line is safe.
+                member = json.dumps(key) + ": " + json.dumps(value, indent=2).replace("\n", "\n  ")
+                gz_f.write((("{\n  " if n_items == 0 else ",\n  ") + member).encode("utf-8"))
+                n_items += 1
+            gz_f.write(b"\n}" if n_items else b"{}")
+        logger.debug(f"Saved {n_items} members to {path}")
+        return n_items
+    except (OSError, TypeError, ValueError) as e:
+        raise ArtifactWriteError(
+            f"Failed to save {path}: {e}",
+            code="io.write_failed",
+            context={"path": str(path)},
+        ) from e
+
+
 def save_jsonl_gz(rows: Iterable[Any], path: Path) -> int:
     """Serializes JSON rows to a deterministic gzipped JSONL file."""
     path = Path(path)
@@ -48,18 +48,22 @@ def local_cache(
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     def decorate(compute: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(compute)
-        def cached(*args: Any, **kwargs: Any) -> T:
+        def cached(*args: Any, refresh_cache: bool = False, **kwargs: Any) -> T:
             cache_key = _validate_cache_key({"namespace": namespace, **dict(key(*args, **kwargs))})
             cache_parent = resolve_cache_dir(namespace)
             cache_root = _cache_root(cache_parent, cache_key)
-            cached_value = _load(cache_root, cache_key, codec.load)
+            cached_value = None if refresh_cache else _load(cache_root, cache_key, codec.load)
             if cached_value is not None:
                 logger.info("loaded cached %s from %s", namespace, cache_root)
                 return cached_value
 
             value = compute(*args, **kwargs)
-            _write(cache_root, cache_key, codec.save, value)
-            logger.info("cached %s in %s", namespace, cache_root)
+            try:
+                _write(cache_root, cache_key, codec.save, value)
+            except (OSError, RetroCastException) as exc:
+                logger.warning("could not cache %s in %s: %s", namespace, cache_root, exc)
+            else:
+                logger.info("cached %s in %s", namespace, cache_root)
             return value
 
         return cached
@@ -69,9 +73,9 @@ def local_cache(
 
 def _load(cache_root: Path, cache_key: CacheKey, load: Callable[[Path], T]) -> T | None:
     manifest_path = cache_root / "manifest.json"
-    if not manifest_path.exists():
-        return None
     try:
+        if not manifest_path.exists():
+            return None
         manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
         if not isinstance(manifest, dict) or manifest.get("cache_key") != dict(cache_key):
             raise ValueError("cache key mismatch")
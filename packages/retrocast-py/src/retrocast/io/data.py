@@ -2,23 +2,33 @@ from __future__ import annotations
 
 import csv
 import gzip
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar, overload
+from typing import Any, Literal, Protocol, TypeVar, overload
 
 from pydantic import TypeAdapter, ValidationError
 
+from retrocast._version import __version__
 from retrocast.exceptions import ArtifactDecodeError, ArtifactFormatError, ArtifactNotFoundError, ArtifactWriteError
+from retrocast.hashing import hash_file
 from retrocast.io.blob import (
     iter_jsonl_gz,
     load_json_gz,
     save_csv_gz,
     save_json_gz,
+    save_json_object_gz,
     save_lines_gz,
 )
+from retrocast.io.cache import json_type_cache, local_cache
 from retrocast.io.provenance import create_manifest
+from retrocast.metrics.bootstrap import (
+    StratifiedMetricSummary,
+    compute_metrics_with_ci,
+    get_is_solvable,
+    make_get_top_k,
+)
 from retrocast.models.analysis import AnalysisReport
 from retrocast.models.candidates import Candidate
 from retrocast.models.evaluation import Evaluation, TargetResult
@@ -40,8 +50,12 @@ _EXECUTION_STATS_ADAPTER = TypeAdapter(ExecutionStats)
 
 T = TypeVar("T")
 
-if TYPE_CHECKING:
-    from retrocast.metrics.bootstrap import StratifiedMetricSummary
+MODEL_STATISTICS_TOP_K = (1, 2, 3, 4, 5, 10, 20, 50)
+
+
+def statistics_top_k(summary_top_k: Sequence[int]) -> list[int]:
+    """Every default K for the performance matrix, plus any extra K requested for the overall summary."""
+    return sorted({*MODEL_STATISTICS_TOP_K, *summary_top_k})
 
 
 class ManifestStatistics(Protocol):
@@ -95,47 +109,112 @@ class BenchmarkResultsLoader:
         self.data_dir = root / "retrocast" if (root / "retrocast").exists() else root
 
     def load_evaluation(self, benchmark: str, model: str, stock: str) -> LoadedEvaluation | None:
-        path = self.data_dir / "4-scored" / benchmark / model / stock / "evaluation.json.gz"
         try:
-            return LoadedEvaluation(load_evaluation(path))
+            return LoadedEvaluation(load_evaluation(self._evaluation_path(benchmark, model, stock)))
         except (ArtifactNotFoundError, ArtifactFormatError, ArtifactDecodeError):
             return None
 
-    def load_statistics(self, benchmark: str, models: list[str], stock: str) -> list[ModelStatistics]:
-        from retrocast.metrics.bootstrap import compute_metric_with_ci, get_is_solvable, make_get_top_k
-
+    def load_statistics(
+        self,
+        benchmark: str,
+        models: list[str],
+        stock: str,
+        *,
+        top_k: Sequence[int] = MODEL_STATISTICS_TOP_K,
+        force_recompute: bool = False,
+    ) -> list[ModelStatistics]:
+        """Bootstrap per-model statistics, replaying cached results for unchanged evaluations.
+
+        Only the requested ``top_k`` values are bootstrapped, so callers that plot a few K skip
+        the rest. Results are cached under the retrocast cache dir keyed by the evaluation file
+        hash and ``top_k``, so re-rendering plots or reports does not rerun the bootstrap.
+        An unreadable or unwritable cache only costs the recompute. ``force_recompute`` ignores and
+        overwrites any cached entry.
+        """
+        top_k = tuple(sorted(set(top_k)))
         stats = []
         for model in models:
-            loaded = self.load_evaluation(benchmark, model, stock)
-            if loaded is None:
+            path = self._evaluation_path(benchmark, model, stock)
+            if not path.exists():
+                continue
+            try:
+                summaries = _model_metric_summaries(path, top_k=top_k, refresh_cache=force_recompute)
+            except (ArtifactNotFoundError, ArtifactFormatError, ArtifactDecodeError):
                 continue
-            targets = list(loaded.results.values())
-            solvability = compute_metric_with_ci(
-                targets,
-                get_is_solvable,
-                "solv_0",
-                stratify_by=_target_route_depth_stratum,
-            )
-            top_k_accuracy = {
-                k: compute_metric_with_ci(
-                    targets,
-                    make_get_top_k(k),
-                    f"top_{k}",
-                    stratify_by=_target_route_depth_stratum,
-                )
-                for k in (1, 2, 3, 4, 5, 10, 20, 50)
-            }
             stats.append(
                 ModelStatistics(
                     model_name=model,
                     benchmark=benchmark,
                     stock=stock,
-                    stock_termination=solvability,
-                    top_k_accuracy=top_k_accuracy,
+                    stock_termination=summaries["solv_0"],
+                    top_k_accuracy={k: summaries[f"top_{k}"] for k in top_k},
                 )
             )
         return stats
 
+    def _evaluation_path(self, benchmark: str, model: str, stock: str) -> Path:
+        return self.data_dir / "4-scored" / benchmark / model / stock / "evaluation.json.gz"
+
+
+def _model_metric_summaries(
+    evaluation_path: Path,
+    *,
+    top_k: Sequence[int] = MODEL_STATISTICS_TOP_K,
+    refresh_cache: bool = False,
+) -> dict[str, StratifiedMetricSummary]:
+    # Hash first so a warm cache never decodes the evaluation; wrap read errors like load_evaluation does.
+    try:
+        evaluation_sha256 = hash_file(evaluation_path)
+    except FileNotFoundError as exc:
+        raise ArtifactNotFoundError(
+            f"File not found: {evaluation_path}",
+            code="io.not_found",
+            context={"path": str(evaluation_path)},
+        ) from exc
+    except OSError as exc:
+        raise ArtifactDecodeError(
+            f"Failed to load {evaluation_path}: {exc}",
+            code="io.decode_failed",
+            context={"path": str(evaluation_path)},
+        ) from exc
+    return _bootstrap_metric_summaries(
+        evaluation_path,
+        evaluation_sha256=evaluation_sha256,
+        top_k=top_k,
+        refresh_cache=refresh_cache,
+    )
+
+
+@local_cache(
+    namespace="model-statistics",
+    key=lambda evaluation_path, *, evaluation_sha256, top_k=MODEL_STATISTICS_TOP_K, n_boot=10000, seed=42: {
+        "retrocast_version": __version__,
+        "function": "model_metric_summaries",
+        "evaluation_sha256": evaluation_sha256,
+        "top_k": list(top_k),
+        "n_boot": n_boot,
+        "seed": seed,
+    },
+    codec=json_type_cache(dict[str, StratifiedMetricSummary]),
+)
+def _bootstrap_metric_summaries(
+    evaluation_path: Path,
+    *,
+    evaluation_sha256: str,
+    top_k: Sequence[int] = MODEL_STATISTICS_TOP_K,
+    n_boot: int = 10000,
+    seed: int = 42,
+) -> dict[str, StratifiedMetricSummary]:
+    targets = list(load_evaluation(evaluation_path).targets.values())
+    extractors = {"solv_0": get_is_solvable, **{f"top_{k}": make_get_top_k(k) for k in top_k}}
+    return compute_metrics_with_ci(
+        targets,
+        extractors,
+        stratify_by=_target_route_depth_stratum,
+        n_boot=n_boot,
+        seed=seed,
+    )
+
 
 def _target_route_depth_stratum(target: TargetResult) -> str | None:
     acceptable_routes = target.target.acceptable_routes
@@ -232,7 +311,7 @@ def load_collected_routes(path: Path) -> CollectedRoutes:
 
 
 def save_collected_routes(routes: CollectedRoutes, path: Path) -> None:
-    _save_model(routes, path, _COLLECTED_ROUTES_ADAPTER, artifact="collected_routes")
+    _save_mapping(routes, path, _ROUTE_LIST_ADAPTER, artifact="collected_routes")
 
 
 def load_collected_candidates(path: Path) -> CollectedCandidates:
@@ -240,7 +319,7 @@ def load_collected_candidates(path: Path) -> CollectedCandidates:
 
 
 def save_collected_candidates(candidates: CollectedCandidates, path: Path) -> None:
-    _save_model(candidates, path, _COLLECTED_CANDIDATES_ADAPTER, artifact="collected_candidates")
+    _save_mapping(candidates, path, _CANDIDATE_LIST_ADAPTER, artifact="collected_candidates")
 
 
 def load_evaluation(path: Path) -> Evaluation:
@@ -297,17 +376,22 @@ def load_stock_file(
     values = set()
     try:
         with gzip.open(path, "rt", encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if reader.fieldnames is None or required_column not in reader.fieldnames:
+            # Plain rows indexed by column: stocks run to millions of rows and a dict per row dominated loading.
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None or required_column not in header:
                 raise ArtifactFormatError(
                     f"invalid stock CSV format: missing {required_column}",
                     code="io.invalid_artifact_shape",
-                    context={"path": str(path), "required_column": required_column, "columns": reader.fieldnames},
+                    context={"path": str(path), "required_column": required_column, "columns": header},
                 )
+            # The last duplicate column wins, as it would in a DictReader row.
+            index = len(header) - 1 - header[::-1].index(required_column)
+            wrap = InChIKeyStr if return_as == "inchikey" else SmilesStr
             for row in reader:
-                value = (row.get(required_column) or "").strip()
+                value = row[index].strip() if index < len(row) else ""
                 if value:
-                    values.add(InChIKeyStr(value) if return_as == "inchikey" else SmilesStr(value))
+                    values.add(wrap(value))
     except OSError as exc:
         raise ArtifactDecodeError(
             f"failed to read stock file {path}: {exc}",
@@ -341,16 +425,27 @@ def _load_model(path: Path, adapter: TypeAdapter[T], *, artifact: str) -> T:
         ) from exc
 
 
+def _save_mapping(value: Mapping[str, T], path: Path, item_adapter: TypeAdapter[T], *, artifact: str) -> None:
+    # Per-target artifacts are dumped and written one member at a time to keep peak memory flat.
+    path = Path(path)
+    try:
+        save_json_object_gz(((key, _dump_json(item, item_adapter)) for key, item in value.items()), path)
+    except ArtifactWriteError as exc:
+        raise ArtifactWriteError(
+            f"Failed to save {artifact} to {path}: {exc}",
+            code=exc.code,
+            context={"path": str(path), "artifact": artifact},
+        ) from exc
+
+
+def _dump_json(value: T, adapter: TypeAdapter[T]) -> Any:
+    return adapter.dump_python(value, mode="json", exclude_none=True, exclude_computed_fields=True)
+
+
 def _save_model(value: T, path: Path, adapter: TypeAdapter[T], *, artifact: str) -> None:
     path = Path(path)
     try:
-        payload = adapter.dump_python(
-            value,
-            mode="json",
-            exclude_none=True,
-            exclude_computed_fields=True,
-        )
-        save_json_gz(payload, path)
+        save_json_gz(_dump_json(value, adapter), path)
     except ArtifactWriteError as exc:
         raise ArtifactWriteError(
             f"Failed to save {artifact} to {path}: {exc}",
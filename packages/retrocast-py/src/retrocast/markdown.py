@@ -22,15 +22,13 @@ def markdown_table(
     if len(alignment) != column_count:
         raise ValueError("markdown table alignment must match the header count")
 
-    lines = [
-        "| " + " | ".join(_cell(value) for value in headers) + " |",
-        "| " + " | ".join(_alignment_marker(value) for value in alignment) + " |",
-    ]
-    for row in rows:
-        if len(row) != column_count:
-            raise ValueError("markdown table rows must match the header count")
-        lines.append("| " + " | ".join(_cell(value) for value in row) + " |")
-    return "\n".join(lines)
+    if any(len(row) != column_count for row in rows):
+        raise ValueError("markdown table rows must match the header count")
+
+    header = "| " + " | ".join(_cell(value) for value in headers) + " |"
+    separator = "| " + " | ".join(_alignment_marker(value) for value in alignment) + " |"
+    body = "\n".join("| " + " | ".join(map(_cell, row)) + " |" for row in rows)
+    return f"{header}\n{separator}\n{body}" if body else f"{header}\n{separator}"
 
 
 def _cell(value: object) -> str:
@@ -5,6 +5,7 @@ from retrocast.metrics.bootstrap import (
     StratifiedMetricSummary,
     check_reliability,
     compute_metric_with_ci,
+    compute_metrics_with_ci,
     summarize_values,
 )
 from retrocast.metrics.constraints import (
@@ -33,6 +34,7 @@ __all__ = [
     "check_reliability",
     "check_task_constraints",
     "compute_metric_with_ci",
+    "compute_metrics_with_ci",
     "compute_paired_difference",
     "compute_pairwise_tournament",
     "compute_probabilistic_ranking",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
@@ -46,22 +46,7 @@ def summarize_values(
     reliability: bool = True,
 ) -> MetricSummary:
     data: npt.NDArray[np.float64] = np.array(values, dtype=np.float64)
-    if len(data) == 0:
-        return MetricSummary(
-            value=0.0,
-            count=0,
-            reliability=ReliabilityFlag(code="LOW_N", message="No data.") if reliability else None,
-        )
-
-    distribution = _bootstrap_mean(data, n_boot=n_boot, seed=seed)
-    value = float(np.mean(data))
-    return MetricSummary(
-        value=value,
-        count=len(data),
-        ci_low=float(np.percentile(distribution, 100 * alpha / 2)),
-        ci_high=float(np.percentile(distribution, 100 * (1 - alpha / 2))),
-        reliability=check_reliability(len(data), value) if reliability else None,
-    )
+    return _summarize_rows(data[np.newaxis, :], n_boot=n_boot, seed=seed, alpha=alpha, reliability=reliability)[0]
 
 
 def compute_metric_with_ci(
@@ -86,6 +71,41 @@ def compute_metric_with_ci(
     return StratifiedMetricSummary(metric_name=metric_name, overall=overall, by_stratum=by_stratum)
 
 
+def compute_metrics_with_ci(
+    targets: Sequence[T],
+    extractors: Mapping[str, Callable[[T], float]],
+    *,
+    stratify_by: Callable[[T], Any] | None = None,
+    n_boot: int = 10000,
+    seed: int = 42,
+) -> dict[str, StratifiedMetricSummary]:
+    """Summaries equal to ``compute_metric_with_ci`` per extractor, drawing each resample once.
+
+    Every metric over the same targets and seed resamples the same indices, so the draws are
+    shared across metrics instead of repeated per metric.
+    """
+    names = list(extractors)
+    rows = np.array([[extractors[name](target) for target in targets] for name in names], dtype=np.float64).reshape(
+        len(names), len(targets)
+    )
+    overall = _summarize_rows(rows, n_boot=n_boot, seed=seed)
+    by_stratum: list[dict[str, MetricSummary]] = [{} for _ in names]
+    if stratify_by is not None:
+        strata: dict[str, list[int]] = defaultdict(list)
+        for position, target in enumerate(targets):
+            stratum = stratify_by(target)
+            if stratum is not None:
+                strata[str(stratum)].append(position)
+        for index, (stratum, positions) in enumerate(strata.items()):
+            summaries = _summarize_rows(rows[:, positions], n_boot=n_boot, seed=seed + index + 1)
+            for row, summary in enumerate(summaries):
+                by_stratum[row][stratum] = summary
+    return {
+        name: StratifiedMetricSummary(metric_name=name, overall=overall[row], by_stratum=by_stratum[row])
+        for row, name in enumerate(names)
+    }
+
+
 def get_is_solvable(target: TargetResult) -> float:
     return 1.0 if any(candidate.satisfies_solv(Tier.ZERO) for candidate in target.candidates) else 0.0
 
@@ -113,14 +133,63 @@ def get_bootstrap_distribution(
     return _bootstrap_mean(values, n_boot=n_boot, seed=seed)
 
 
+def _summarize_rows(
+    rows: npt.NDArray[np.float64],
+    *,
+    n_boot: int,
+    seed: int,
+    alpha: float = 0.05,
+    reliability: bool = True,
+) -> list[MetricSummary]:
+    count = rows.shape[1]
+    if count == 0:
+        return [
+            MetricSummary(
+                value=0.0,
+                count=0,
+                reliability=ReliabilityFlag(code="LOW_N", message="No data.") if reliability else None,
+            )
+            for _ in rows
+        ]
+
+    distributions = _bootstrap_means(rows, n_boot=n_boot, seed=seed)
+    summaries = []
+    for data, distribution in zip(rows, distributions, strict=True):
+        value = float(np.mean(data))
+        summaries.append(
+            MetricSummary(
+                value=value,
+                count=count,
+                ci_low=float(np.percentile(distribution, 100 * alpha / 2)),
+                ci_high=float(np.percentile(distribution, 100 * (1 - alpha / 2))),
+                reliability=check_reliability(count, value) if reliability else None,
+            )
+        )
+    return summaries
+
+
 def _bootstrap_mean(values: npt.NDArray[np.float64], *, n_boot: int, seed: int) -> npt.NDArray[np.float64]:
     if len(values) == 0:
         return np.zeros(n_boot, dtype=np.float64)
 
+    return _bootstrap_means(values[np.newaxis, :], n_boot=n_boot, seed=seed)[0]
+
+
+def _bootstrap_means(rows: npt.NDArray[np.float64], *, n_boot: int, seed: int) -> npt.NDArray[np.float64]:
+    """Bootstrap means for each row of ``rows``, resampling every row with the same indices."""
     rng = np.random.default_rng(seed)
-    means = np.empty(n_boot, dtype=np.float64)
+    n_values = rows.shape[1]
+    means = np.empty((len(rows), n_boot), dtype=np.float64)
+    # Sums of 0/1 values are exact integers, so counting hits in a bool gather gives the same means
+    # as np.mean while the per-chunk temporary is one byte per draw instead of eight.
+    is_binary = np.all((rows == 0.0) | (rows == 1.0), axis=1)
+    hits = rows != 0.0
     for start in range(0, n_boot, BOOTSTRAP_CHUNK_SIZE):
         stop = min(start + BOOTSTRAP_CHUNK_SIZE, n_boot)
-        indices = rng.integers(0, len(values), (stop - start, len(values)))
-        means[start:stop] = np.mean(values[indices], axis=1)
+        indices = rng.integers(0, n_values, (stop - start, n_values))
+        for row, values in enumerate(rows):
+            if is_binary[row]:
+                means[row, start:stop] = np.count_nonzero(hits[row][indices], axis=1) / n_values
+            else:
+                means[row, start:stop] = np.mean(values[indices], axis=1)
     return means
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
 from typing import Protocol, cast
 
 from retrocast.chem import get_inchi_key, reduce_inchikey
@@ -37,12 +39,13 @@ class StockTerminationChecker:
     def __init__(
         self,
         *,
-        stocks: Mapping[str, set[InChIKeyStr]],
+        stocks: Mapping[str, AbstractSet[InChIKeyStr]],
         match_level: InChIKeyLevel = InChIKeyLevel.FULL,
     ) -> None:
         self.match_level = match_level
-        self._stock_keys_by_name = {
-            stock_name: {str(reduce_inchikey(inchikey, match_level)) for inchikey in stock_values}
+        # Interned keys share one object per InChIKey across stocks, which keeps large registries compact.
+        self._stock_keys_by_name: dict[str, frozenset[str]] = {
+            stock_name: frozenset(sys.intern(str(reduce_inchikey(inchikey, match_level))) for inchikey in stock_values)
             for stock_name, stock_values in stocks.items()
         }
 
@@ -66,11 +69,11 @@ class StockTerminationChecker:
                 )
             ]
 
-        missing_leaves = sorted(
-            {leaf.value.inchikey for leaf in route.iter_leaves() if leaf.key(self.match_level) not in stock_keys}
-        )
-        if not missing_leaves:
+        leaves = [(leaf.key(self.match_level), leaf.value.inchikey) for leaf in route.iter_leaves()]
+        # Most scored routes terminate in stock; a single superset test settles them without a per-leaf lookup loop.
+        if stock_keys.issuperset(key for key, _ in leaves):
             return []
+        missing_leaves = sorted({inchikey for key, inchikey in leaves if key not in stock_keys})
         return [
             CheckResult(
                 code="constraint.stock_termination.missing_leaf",
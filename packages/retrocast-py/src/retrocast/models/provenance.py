@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -96,3 +97,10 @@ class VerificationReport(BaseModel):
         self.issues.append(VerificationIssue(level=level, path=path, message=message, category=category))
         if level == "FAIL":
             self.is_valid = False
+
+    def extend(self, issues: Iterable[VerificationIssue]) -> None:
+        """Append a batch of issues and update validity once."""
+        start = len(self.issues)
+        self.issues.extend(issues)
+        if any(issue.level == "FAIL" for issue in self.issues[start:]):
+            self.is_valid = False
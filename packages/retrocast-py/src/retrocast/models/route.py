@@ -31,6 +31,25 @@ def _stable_hash(value: Any) -> str:
     return hash_json(value)
 
 
+def _cached_hash(value: tuple[Any, ...], cache: dict[tuple[Any, ...], str] | None) -> str:
+    if cache is None:
+        return _stable_hash(value)
+    signature = cache.get(value)
+    if signature is None:
+        signature = cache[value] = _stable_hash(value)
+    return signature
+
+
+def _sorted_tuple(values: list[str]) -> tuple[str, ...]:
+    # Most reactions have one or two reactants; order those directly instead of going through sorted().
+    if len(values) == 1:
+        return (values[0],)
+    if len(values) == 2:
+        first, second = values
+        return (first, second) if first <= second else (second, first)
+    return tuple(sorted(values))
+
+
 def _validate_depth(depth: int | None) -> None:
     if depth is not None and depth < 0:
         raise ValueError("depth must be non-negative")
@@ -216,23 +235,36 @@ def _molecule_subtree_key(
     match_level: InChIKeyLevel = InChIKeyLevel.FULL,
     *,
     depth: int | None = None,
+    signature_cache: dict[tuple[Any, ...], str] | None = None,
 ) -> tuple[Any, ...]:
-    """Compute subtree identity from raw molecules before a route-bound view exists."""
-    _validate_depth(depth)
-    reaction = molecule.product_of
-    if reaction is None or depth == 0:
-        return ("mol", molecule.key(match_level))
+    """Compute subtree identity from raw molecules before a route-bound view exists.
 
-    next_depth = None if depth is None else depth - 1
-    child_signatures = sorted(
-        _stable_hash(_molecule_subtree_key(reactant, match_level, depth=next_depth)) for reactant in reaction.reactants
-    )
-    return (
-        "mol",
-        molecule.key(match_level),
-        _reaction_key(molecule, reaction, match_level),
-        tuple(child_signatures),
-    )
+    ``signature_cache`` maps child keys to their hashes; sharing one across routes hashes each distinct subtree once.
+    """
+    _validate_depth(depth)
+    # Post-order over an explicit stack; keys are memoized per (node, remaining depth) so a node is keyed once.
+    keys: dict[tuple[int, int | None], tuple[Any, ...]] = {}
+    stack: list[tuple[Molecule, int | None, bool]] = [(molecule, depth, False)]
+    while stack:
+        node, remaining, expanded = stack.pop()
+        node_id = (id(node), remaining)
+        reaction = node.product_of
+        if reaction is None or remaining == 0:
+            keys[node_id] = ("mol", node.key(match_level))
+            continue
+        next_remaining = None if remaining is None else remaining - 1
+        if not expanded:
+            if node_id not in keys:
+                stack.append((node, remaining, True))
+                stack.extend((reactant, next_remaining, False) for reactant in reaction.reactants)
+            continue
+        child_keys = [keys[(id(reactant), next_remaining)] for reactant in reaction.reactants]
+        node_key = node.key(match_level)
+        # Same shape as _reaction_key, reusing the reactant keys already reduced in the child tuples.
+        reaction_key = ("rxn", node_key, _sorted_tuple([child_key[1] for child_key in child_keys]))
+        child_signatures = _sorted_tuple([_cached_hash(child_key, signature_cache) for child_key in child_keys])
+        keys[node_id] = ("mol", node_key, reaction_key, child_signatures)
+    return keys[(id(molecule), depth)]
 
 
 def _reaction_key(
@@ -243,7 +275,7 @@ def _reaction_key(
     return (
         "rxn",
         product.key(match_level),
-        tuple(sorted(reactant.key(match_level) for reactant in reaction.reactants)),
+        _sorted_tuple([reactant.key(match_level) for reactant in reaction.reactants]),
     )
 
 
@@ -319,6 +351,31 @@ def _molecule_content_subtree_key(
     )
 
 
+def _molecule_depth(molecule: Molecule) -> int:
+    return _molecule_topology(molecule, check_convergence=False)[0]
+
+
+def _molecule_topology(molecule: Molecule, *, check_convergence: bool = True) -> tuple[int, bool]:
+    # Walks the plain models; depth and convergence only need the tree shape, not route-bound views.
+    # Depth-only callers skip the per-reaction convergence count.
+    max_depth = 0
+    convergent = False
+    stack: list[tuple[Molecule, int]] = [(molecule, 0)]
+    while stack:
+        current, depth = stack.pop()
+        reaction = current.product_of
+        if reaction is None:
+            max_depth = max(max_depth, depth)
+            continue
+        if not reaction.reactants:
+            max_depth = max(max_depth, depth + 1)
+            continue
+        if check_convergence and not convergent:
+            convergent = sum(reactant.product_of is not None for reactant in reaction.reactants) > 1
+        stack.extend((reactant, depth + 1) for reactant in reaction.reactants)
+    return max_depth, convergent
+
+
 # section: route model
 
 
@@ -361,17 +418,21 @@ class Route(BaseModel):
         match_level: InChIKeyLevel = InChIKeyLevel.FULL,
         *,
         depth: int | None = None,
+        signature_cache: dict[tuple[Any, ...], str] | None = None,
     ) -> tuple[Any, ...]:
         _validate_depth(depth)
-        return self.molecule_at(RoutePath.target()).subtree_key(match_level, depth=depth)
+        return self.molecule_at(RoutePath.target()).subtree_key(
+            match_level, depth=depth, signature_cache=signature_cache
+        )
 
     def signature(
         self,
         match_level: InChIKeyLevel = InChIKeyLevel.FULL,
         *,
         depth: int | None = None,
+        signature_cache: dict[tuple[Any, ...], str] | None = None,
     ) -> str:
-        return _stable_hash(self.key(match_level, depth=depth))
+        return _cached_hash(self.key(match_level, depth=depth, signature_cache=signature_cache), signature_cache)
 
     def leaves(self) -> list[MoleculeView]:
         return list(self.iter_leaves())
@@ -464,6 +525,10 @@ class Route(BaseModel):
             stack.extend(reaction.reactants)
         return False
 
+    def topology(self) -> tuple[int, bool]:
+        """Return ``(depth(), is_convergent())`` from a single walk over the route."""
+        return _molecule_topology(self.target)
+
 
 # section: route-bound views
 
@@ -546,36 +611,27 @@ class MoleculeView(BaseModel):
             yield from reactant.iter_molecules()
 
     def depth(self) -> int:
-        max_depth = 0
-        stack: list[tuple[MoleculeView, int]] = [(self, 0)]
-        while stack:
-            molecule, depth = stack.pop()
-            reaction = molecule.produced_by()
-            if reaction is None:
-                max_depth = max(max_depth, depth)
-                continue
-            if not reaction.value.reactants:
-                max_depth = max(max_depth, depth + 1)
-                continue
-            for reactant in reaction.reactants():
-                stack.append((reactant, depth + 1))
-        return max_depth
+        return _molecule_depth(self.value)
 
     def subtree_key(
         self,
         match_level: InChIKeyLevel = InChIKeyLevel.FULL,
         *,
         depth: int | None = None,
+        signature_cache: dict[tuple[Any, ...], str] | None = None,
     ) -> tuple[Any, ...]:
-        return _molecule_subtree_key(self.value, match_level, depth=depth)
+        return _molecule_subtree_key(self.value, match_level, depth=depth, signature_cache=signature_cache)
 
     def subtree_signature(
         self,
         match_level: InChIKeyLevel = InChIKeyLevel.FULL,
         *,
         depth: int | None = None,
+        signature_cache: dict[tuple[Any, ...], str] | None = None,
     ) -> str:
-        return _stable_hash(self.subtree_key(match_level, depth=depth))
+        return _cached_hash(
+            self.subtree_key(match_level, depth=depth, signature_cache=signature_cache), signature_cache
+        )
 
     def content_subtree_key(
         self,
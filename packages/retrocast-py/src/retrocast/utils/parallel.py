@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CHUNKS_PER_WORKER = 4
+
+
+def uses_process_pool(max_workers: int | None, item_count: int) -> bool:
+    """Whether ``map_in_processes`` fans out to a pool for this many items, or stays in-process."""
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    return max_workers is not None and max_workers > 1 and item_count > 1
+
+
+def map_in_processes(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    *,
+    max_workers: int | None = None,
+    initializer: Callable[..., object] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """Map ``fn`` over ``items`` in order, fanning out to a process pool when ``max_workers > 1``.
+
+    ``fn`` and every item must be picklable when a pool is used. ``None`` or ``1`` keeps
+    the work in-process so results and tracebacks stay identical to a plain loop.
+    ``initializer(*initargs)`` runs once in each pool worker, so large shared state is sent
+    once per worker instead of with every chunk. It never runs on the in-process path.
+    """
+    if not uses_process_pool(max_workers, len(items)):
+        yield from map(fn, items)
+        return
+
+    assert max_workers is not None
+    chunksize = max(1, len(items) // (max_workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs) as pool:
+        yield from pool.map(fn, items, chunksize=chunksize)
+
+
+def map_in_threads(fn: Callable[[T], R], items: Sequence[T], *, max_workers: int | None = None) -> Iterator[R]:
+    """Map ``fn`` over ``items`` in order, fanning out to a thread pool when ``max_workers > 1``.
+
+    Suited to work that releases the GIL, such as file reads and hashlib updates.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if max_workers is None or max_workers == 1 or len(items) <= 1:
+        yield from map(fn, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        yield from pool.map(fn, items)
+
+
+__all__ = ["map_in_processes", "map_in_threads", "uses_process_pool"]
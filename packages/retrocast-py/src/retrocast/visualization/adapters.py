@@ -48,12 +48,16 @@ class StabilityData:
 
 
 def stats_to_diagnostic_series(stats: Any) -> list[PlotSeries]:
-    series = [_create_depth_series(_solvability_metric(stats), "Solvability", get_metric_color("solvability"), "bar")]
-    for k in sorted(getattr(stats, "top_k_accuracy", {})):
-        if k in {1, 2, 3, 4, 5, 10, 20, 50}:
+    series: list[PlotSeries] = []
+    solvability = _solvability_metric(stats)
+    if _depth_strata(solvability):
+        series.append(_create_depth_series(solvability, "Solvability", get_metric_color("solvability"), "bar"))
+    top_k_accuracy = getattr(stats, "top_k_accuracy", {})
+    for k in sorted(top_k_accuracy):
+        if k in {1, 2, 3, 4, 5, 10, 20, 50} and _depth_strata(top_k_accuracy[k]):
             series.append(
                 _create_depth_series(
-                    stats.top_k_accuracy[k],
+                    top_k_accuracy[k],
                     f"Top-{k}",
                     get_metric_color("top", k),
                     "bar",
@@ -157,8 +161,12 @@ def stats_to_stability_data(
     )
 
 
+def _depth_strata(metric: Any) -> Any:
+    return getattr(metric, "by_stratum", getattr(metric, "by_group", {}))
+
+
 def _create_depth_series(metric: Any, name: str, color: str, mode: str) -> PlotSeries:
-    by_stratum = getattr(metric, "by_stratum", getattr(metric, "by_group", {}))
+    by_stratum = _depth_strata(metric)
     x_values: list[int | float | str] = []
     y_values: list[float] = []
     y_upper: list[float] = []
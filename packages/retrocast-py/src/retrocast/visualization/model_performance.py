@@ -11,8 +11,8 @@ from retrocast.visualization.plots import (
 )
 
 
-def plot_single_model_diagnostics(stats: Any):
-    return plot_diagnostics(stats)
+def plot_single_model_diagnostics(stats: Any, *, cache: bool = False):
+    return plot_diagnostics(stats, cache=cache)
 
 
 def plot_multi_model_comparison(models_stats: list[Any], metric_type: str = "Top-1", k: int = 1):
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import asdict
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+import plotly
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
+from retrocast._version import __version__
+from retrocast.hashing import hash_json
+from retrocast.io.cache import CacheCodec, local_cache
 from retrocast.models.analysis import AnalysisReport
 from retrocast.visualization import adapters, theme
 from retrocast.visualization.adapters import PlotSeries
@@ -18,25 +26,51 @@ def plot_analysis_report(report: AnalysisReport, *, title: str = "Analysis Repor
     return fig
 
 
-def plot_diagnostics(stats: Any):
-    fig = go.Figure()
-    for series in adapters.stats_to_diagnostic_series(stats):
-        _render_series(fig, series)
+def plot_diagnostics(stats: Any, *, cache: bool = False):
+    series_list = adapters.stats_to_diagnostic_series(stats)
     title = f"Performance Diagnostics: {stats.model_name}"
+    if cache:
+        return _cached_diagnostics_figure(title, series_list)
+    return _diagnostics_figure(title, series_list)
+
+
+def _diagnostics_figure(title: str, series_list: list[PlotSeries]):
+    fig = go.Figure(
+        data=[_series_trace(series) for series in series_list],
+        layout={"barmode": "group", "yaxis": {"range": [0, 100]}},
+    )
     theme.apply_layout(fig, title=title, x_title="Route Depth", y_title="Percentage (%)")
-    fig.update_layout(barmode="group")
-    fig.update_yaxes(range=[0, 100])
     return fig
 
 
+def _load_figure(cache_root: Path) -> go.Figure:
+    return pio.from_json((cache_root / "figure.json").read_text(encoding="utf-8"))
+
+
+def _save_figure(cache_root: Path, fig: go.Figure) -> None:
+    (cache_root / "figure.json").write_text(fig.to_json(), encoding="utf-8")
+
+
+_cached_diagnostics_figure = local_cache(
+    namespace="diagnostic-figures",
+    key=lambda title, series_list: {
+        "retrocast_version": __version__,
+        # figure.json is plotly's own serialization, styled by the theme; either changing invalidates it.
+        "plotly_version": plotly.__version__,
+        "theme_sha256": theme.theme_fingerprint(),
+        "function": "diagnostics_figure",
+        "title": title,
+        "series_sha256": hash_json([asdict(series) for series in series_list]),
+    },
+    codec=CacheCodec(load=_load_figure, save=_save_figure),
+)(_diagnostics_figure)
+
+
 def plot_comparison(models_stats: list[Any], metric_type: str = "Top-K", k: int = 1):
     series_list = adapters.stats_to_comparison_series(models_stats, metric_type, k)
     offsets = _calculate_offsets(len(series_list), width=0.6)
-    fig = go.Figure()
-    all_x = set()
-    for index, series in enumerate(series_list):
-        all_x.update(series.x)
-        _render_series(fig, series, x_offset=offsets[index])
+    fig = go.Figure(data=[_series_trace(series, x_offset=offsets[index]) for index, series in enumerate(series_list)])
+    all_x = {value for series in series_list for value in series.x}
     title_suffix = f" (k={k})" if metric_type == "Top-K" else ""
     theme.apply_layout(
         fig, title=f"Model Comparison: {metric_type}{title_suffix}", x_title="Route Depth", y_title="Percentage (%)"
@@ -52,9 +86,7 @@ def plot_overall_summary(models_stats: list[Any], top_k_values: list[int] | None
     top_k_values = top_k_values or [1, 2, 3, 4, 5, 10, 20, 50]
     series_list = adapters.stats_to_overall_series(models_stats, top_k_values)
     offsets = _calculate_offsets(len(series_list), width=0.6)
-    fig = go.Figure()
-    for index, series in enumerate(series_list):
-        _render_series(fig, series, x_offset=offsets[index])
+    fig = go.Figure(data=[_series_trace(series, x_offset=offsets[index]) for index, series in enumerate(series_list)])
     labels = ["Solvability"] + [f"Top-{k}" for k in top_k_values]
     theme.apply_layout(fig, title="Overall Performance Summary", x_title="Metric", y_title="Percentage (%)")
     fig.update_xaxes(tickmode="array", tickvals=list(range(len(labels))), ticktext=labels)
@@ -226,7 +258,8 @@ def plot_pareto_frontier(
     k: int = 10,
     time_based: bool = False,
 ):
-    fig = go.Figure()
+    # One plain trace dict per model keeps the per-model legend entries; go.Figure validates them all at once.
+    traces: list[dict[str, Any]] = []
     pareto_points: list[tuple[float, float]] = []
     for stats in models_stats:
         model_name = stats.model_name
@@ -240,29 +273,31 @@ def plot_pareto_frontier(
         accuracy = metric.value * 100
         ci_low = (metric.ci_low if metric.ci_low is not None else metric.value) * 100
         ci_high = (metric.ci_high if metric.ci_high is not None else metric.value) * 100
-        config = model_config.get(
-            model_name, {"legend": model_name, "short": model_name[:10], "color": theme.get_model_color(model_name)}
-        )
+        config = model_config.get(model_name)
+        if config is None:
+            # Built only on a miss rather than as an eager .get() default for every model.
+            config = {"legend": model_name, "short": model_name[:10], "color": theme.get_model_color(model_name)}
         pareto_points.append((x_value, accuracy))
-        fig.add_trace(
-            go.Scatter(
-                x=[x_value],
-                y=[accuracy],
-                name=config["legend"],
-                mode="markers+text",
-                marker={"color": config["color"], "size": 12, "line": {"width": 1, "color": "white"}},
-                text=[config["short"]],
-                textposition="middle right",
-                error_y={
+        traces.append(
+            {
+                "type": "scatter",
+                "x": [x_value],
+                "y": [accuracy],
+                "name": config["legend"],
+                "mode": "markers+text",
+                "marker": {"color": config["color"], "size": 12, "line": {"width": 1, "color": "white"}},
+                "text": [config["short"]],
+                "textposition": "middle right",
+                "error_y": {
                     "type": "data",
                     "symmetric": False,
                     "array": [ci_high - accuracy],
                     "arrayminus": [accuracy - ci_low],
                     "visible": True,
                 },
-                customdata=[[model_name, metric.count, ci_low, ci_high]],
-                hovertemplate="<b>%{customdata[0]}</b><br>x=%{x:.2f}<br>Top-K=%{y:.1f}%<br>CI=[%{customdata[2]:.1f}%, %{customdata[3]:.1f}%]<br>N=%{customdata[1]}<extra></extra>",
-            )
+                "customdata": [[model_name, metric.count, ci_low, ci_high]],
+                "hovertemplate": "<b>%{customdata[0]}</b><br>x=%{x:.2f}<br>Top-K=%{y:.1f}%<br>CI=[%{customdata[2]:.1f}%, %{customdata[3]:.1f}%]<br>N=%{customdata[1]}<extra></extra>",
+            }
         )
     pareto_points.sort(key=lambda point: point[0])
     frontier = []
@@ -272,49 +307,50 @@ def plot_pareto_frontier(
             frontier.append((x_value, accuracy))
             best_accuracy = accuracy
     if len(frontier) > 1:
-        fig.add_trace(
-            go.Scatter(
-                x=[point[0] for point in frontier],
-                y=[point[1] for point in frontier],
-                mode="lines",
-                name="Pareto Frontier",
-                line={"color": "rgba(128,128,128,0.5)", "width": 2, "dash": "dash"},
-                hoverinfo="skip",
-            )
+        traces.append(
+            {
+                "type": "scatter",
+                "x": [point[0] for point in frontier],
+                "y": [point[1] for point in frontier],
+                "mode": "lines",
+                "name": "Pareto Frontier",
+                "line": {"color": "rgba(128,128,128,0.5)", "width": 2, "dash": "dash"},
+                "hoverinfo": "skip",
+            }
         )
+    fig = go.Figure(data=traces)
     x_title = "Wall Time (minutes)" if time_based else "Total Cost (USD)"
     theme.apply_layout(fig, x_title=x_title, y_title=f"Top-{k} Accuracy (%)", height=600, width=1200)
     fig.update_yaxes(range=[0, 100])
     return fig
 
 
-def _render_series(fig: Any, series: PlotSeries, x_offset: float = 0.0) -> None:
+def _series_trace(series: PlotSeries, x_offset: float = 0.0) -> dict[str, Any]:
+    # Plain trace dicts are validated once by go.Figure instead of once per trace object and again on insertion.
     x_values = [value + x_offset if isinstance(value, int | float) else value for value in series.x]
-    error_y = None
-    if series.y_err_upper:
-        error_y = {
-            "type": "data",
-            "symmetric": False,
-            "array": series.y_err_upper,
-            "arrayminus": series.y_err_lower,
-            "visible": True,
-        }
-    common_args = {
+    trace: dict[str, Any] = {
+        "type": "bar" if series.mode_hint == "bar" else "scatter",
         "name": series.name,
         "x": x_values,
-        "y": series.y,
-        "marker_color": series.color,
+        "y": np.asarray(series.y, dtype=np.float64),
+        "marker": {"color": series.color},
         "customdata": series.custom_data,
         "hovertemplate": "<b>%{fullData.name}</b><br>Value: %{y:.1f}%<br>N=%{customdata[0]}<br>CI: [%{customdata[1]:.1f}%, %{customdata[2]:.1f}%]<br>Status: %{customdata[3]}<extra></extra>",
     }
-    if series.mode_hint == "bar":
-        fig.add_trace(go.Bar(**common_args, error_y=error_y))
-        return
-    if error_y is not None:
-        error_y = {**error_y, "width": 4, "thickness": 1.5}
-    fig.add_trace(
-        go.Scatter(**common_args, mode="markers", error_y=error_y, marker={"color": series.color, "size": 10})
-    )
+    if series.y_err_upper:
+        trace["error_y"] = {
+            "type": "data",
+            "symmetric": False,
+            "array": np.asarray(series.y_err_upper, dtype=np.float64),
+            "arrayminus": np.asarray(series.y_err_lower, dtype=np.float64),
+            "visible": True,
+        }
+    if series.mode_hint != "bar":
+        trace["mode"] = "markers"
+        trace["marker"]["size"] = 10
+        if "error_y" in trace:
+            trace["error_y"].update(width=4, thickness=1.5)
+    return trace
 
 
 def _calculate_offsets(n_items: int, width: float = 0.6) -> list[float]:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections import Counter
 from dataclasses import dataclass
 
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
@@ -24,13 +25,14 @@ def extract_route_stats(routes: dict[str, Route]) -> list[RouteStats]:
     stats = []
     for route in routes.values():
         smiles = route.target.smiles
+        depth, is_convergent = route.topology()
         stats.append(
             RouteStats(
-                depth=route.depth(),
+                depth=depth,
                 target_hac=get_heavy_atom_count(smiles),
                 target_mw=get_molecular_weight(smiles),
                 target_chiral=get_chiral_center_count(smiles),
-                is_convergent=is_convergent_route(route),
+                is_convergent=is_convergent,
             )
         )
     return stats
@@ -69,8 +71,8 @@ def create_route_comparison_figure(
     n5_color = "#a53860"
     depths = sorted({item.depth for item in n1_stats} | {item.depth for item in n5_stats})
 
-    add_count_bars(fig, n1_stats, n5_stats, depths, n1_color, n5_color, row=1, convergent_only=False)
-    add_count_bars(fig, n1_stats, n5_stats, depths, n1_color, n5_color, row=2, convergent_only=True)
+    max_total = add_count_bars(fig, n1_stats, n5_stats, depths, n1_color, n5_color, row=1, convergent_only=False)
+    max_convergent = add_count_bars(fig, n1_stats, n5_stats, depths, n1_color, n5_color, row=2, convergent_only=True)
     add_violin_traces(fig, n1_stats, n5_stats, depths, "target_hac", n1_color, n5_color, row=3)
     add_violin_traces(fig, n1_stats, n5_stats, depths, "target_mw", n1_color, n5_color, row=4)
     add_violin_traces(
@@ -86,19 +88,10 @@ def create_route_comparison_figure(
 
     apply_layout(fig, height=1400)
     fig.update_layout(barmode="group", margin={"t": 40})
-    for row in range(1, 6):
-        fig.update_xaxes(title_text="Route Length" if row == 5 else None, range=[1.5, 10.5], row=row, col=1)
+    fig.update_xaxes(range=[1.5, 10.5])
+    fig.update_xaxes(title_text="Route Length", row=5, col=1)
 
     title_standoff = 10
-    n1_total = count_by_depth(n1_stats, convergent_only=False)
-    n5_total = count_by_depth(n5_stats, convergent_only=False)
-    n1_convergent = count_by_depth(n1_stats, convergent_only=True)
-    n5_convergent = count_by_depth(n5_stats, convergent_only=True)
-    max_total = max([n1_total[depth] for depth in depths] + [n5_total[depth] for depth in depths], default=0)
-    max_convergent = max(
-        [n1_convergent[depth] for depth in depths] + [n5_convergent[depth] for depth in depths],
-        default=0,
-    )
     fig.update_yaxes(title_text="Total Count", title_standoff=title_standoff, range=[0, max_total * 1.15], row=1, col=1)
     fig.update_yaxes(
         title_text="Convergent Count",
@@ -123,7 +116,7 @@ def add_count_bars(
     *,
     row: int,
     convergent_only: bool,
-) -> None:
+) -> int:
     n1_counts = count_by_depth(n1_stats, convergent_only=convergent_only)
     n5_counts = count_by_depth(n5_stats, convergent_only=convergent_only)
     showlegend = not convergent_only
@@ -155,6 +148,7 @@ def add_count_bars(
         row=row,
         col=1,
     )
+    return max((max(n1_counts[depth], n5_counts[depth]) for depth in depths), default=0)
 
 
 def add_violin_traces(
@@ -170,9 +164,12 @@ def add_violin_traces(
 ) -> None:
     for stats, name, color, side in ((n1_stats, "n1", n1_color, "negative"), (n5_stats, "n5", n5_color, "positive")):
         values_by_depth = values_for_depths(stats, depths, field)
-        x_values = [depth for depth, values in values_by_depth.items() for _ in values]
-        y_values = [value for values in values_by_depth.values() for value in values]
-        if y_values:
+        # Column arrays serialize as compact typed arrays instead of one JSON number per route.
+        x_values = np.repeat(
+            np.array(list(values_by_depth), dtype=np.int64), [len(values) for values in values_by_depth.values()]
+        )
+        y_values = np.array([value for values in values_by_depth.values() for value in values])
+        if y_values.size:
             fig.add_trace(
                 go.Violin(
                     x=x_values,
@@ -194,4 +191,10 @@ def count_by_depth(stats: list[RouteStats], *, convergent_only: bool) -> Counter
 
 
 def values_for_depths(stats: list[RouteStats], depths: list[int], field: str) -> dict[int, list[int | float]]:
-    return {depth: [getattr(item, field) for item in stats if item.depth == depth] for depth in depths}
+    # Bucket in one pass over the stats rather than one filtering pass per depth.
+    values: dict[int, list[int | float]] = {depth: [] for depth in depths}
+    for item in stats:
+        bucket = values.get(item.depth)
+        if bucket is not None:
+            bucket.append(getattr(item, field))
+    return values
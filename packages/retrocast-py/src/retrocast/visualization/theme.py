@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import hashlib
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
 from typing import Any
 
 from ischemist.colors import ColorPalette
 from ischemist.plotly import Styler
 
+from retrocast.hashing import hash_file, hash_json
+
 COLOR_SOLVABILITY = "#b892ff"
 COLOR_TOP_1 = "#ffc2e2"
 COLOR_TOP_5 = "#ff90b3"
 COLOR_TOP_10 = "#ef7a85"
 COLOR_DEFAULT = "#95a5a6"
+_TOP_K_COLORS = {1: COLOR_TOP_1, 5: COLOR_TOP_5, 10: COLOR_TOP_10}
+# Styler is immutable and caches its derived style dicts, so one instance serves every figure.
+_STYLER = Styler()
 
 _MODEL_COLORS_HEX = [
     "#1f77b4",
@@ -43,12 +51,7 @@ def get_metric_color(metric_name: str, k: int | None = None) -> str:
                 k = int(clean_name.replace("top", "").replace("-", "").strip())
             except ValueError:
                 return COLOR_DEFAULT
-        if k == 1:
-            return COLOR_TOP_1
-        if k == 5:
-            return COLOR_TOP_5
-        if k == 10:
-            return COLOR_TOP_10
+        return _TOP_K_COLORS.get(k, COLOR_DEFAULT)
     return COLOR_DEFAULT
 
 
@@ -77,10 +80,23 @@ def apply_layout(
     if legend_top:
         layout_args["legend"] = {"orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "right", "x": 1}
     fig.update_layout(**layout_args)
-    Styler().apply_style(fig)
+    _STYLER.apply_style(fig)
     return fig
 
 
+@cache
+def theme_fingerprint() -> str:
+    """Identify the styling applied here: this module's source plus the installed ischemist Styler.
+
+    Caches of rendered figures key on it, so a color, layout or Styler change re-renders them.
+    """
+    try:
+        styler_version = version("ischemist")
+    except PackageNotFoundError:
+        styler_version = "unknown"
+    return hash_json({"theme_sha256": hash_file(Path(__file__)), "ischemist_version": styler_version})
+
+
 __all__ = [
     "COLOR_DEFAULT",
     "COLOR_SOLVABILITY",
@@ -91,4 +107,5 @@ __all__ = [
     "apply_layout",
     "get_metric_color",
     "get_model_color",
+    "theme_fingerprint",
 ]
@@ -10,12 +10,13 @@ from retrocast.workflow.collect import (
     collect_routes,
 )
 from retrocast.workflow.ingest import ingest_candidates, ingest_routes
-from retrocast.workflow.score import score
+from retrocast.workflow.score import acceptable_route_identities, score
 
 __all__ = [
     "AcceptableRouteMatch",
     "CollectedCandidates",
     "CollectedRoutes",
+    "acceptable_route_identities",
     "adapt_candidates",
     "adapt_route",
     "adapt_routes",
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Iterator, Mapping
+from functools import partial
 from typing import Any
 
 from retrocast.adapters.base import Adapter, AdaptMode
+from retrocast.models.candidates import Candidate
 from retrocast.models.task import Target, Task
+from retrocast.utils.parallel import map_in_processes
 from retrocast.workflow.adapt import adapt_candidates, adapt_routes
 from retrocast.workflow.collect import (
     CollectedCandidates,
@@ -51,24 +54,59 @@ def ingest_candidates(
     mode: AdaptMode = "strict",
     max_candidates: int | None = None,
     progress_callback: Callable[[], None] | None = None,
+    max_workers: int | None = None,
 ) -> CollectedCandidates:
-    """Adapt raw planner output into candidates and collect them by target id."""
-    candidates = []
-    for target, payload, source_key in _target_payloads(raw_payload, task):
-        candidates.extend(
-            adapt_candidates(
-                payload,
-                adapter,
-                mode=mode,
-                target=target,
-                source_key=source_key,
-                max_candidates=max_candidates,
-                progress_callback=progress_callback,
+    """Adapt raw planner output into candidates and collect them by target id.
+
+    With ``max_workers > 1`` targets are adapted in a process pool and progress advances
+    once per candidate as each target finishes; the adapter must be picklable.
+    """
+    if max_workers is None or max_workers == 1:
+        candidates = []
+        for target, payload, source_key in _target_payloads(raw_payload, task):
+            candidates.extend(
+                adapt_candidates(
+                    payload,
+                    adapter,
+                    mode=mode,
+                    target=target,
+                    source_key=source_key,
+                    max_candidates=max_candidates,
+                    progress_callback=progress_callback,
+                )
             )
-        )
+        return collect_candidates(candidates, task)
+
+    adapt_target = partial(_adapt_target_candidates, adapter=adapter, mode=mode, max_candidates=max_candidates)
+    candidates = []
+    for target_candidates in map_in_processes(
+        adapt_target, list(_target_payloads(raw_payload, task)), max_workers=max_workers
+    ):
+        candidates.extend(target_candidates)
+        if progress_callback is not None:
+            for _ in target_candidates:
+                progress_callback()
     return collect_candidates(candidates, task)
 
 
+def _adapt_target_candidates(
+    target_payload: tuple[Target | None, Any, str | None],
+    *,
+    adapter: Adapter,
+    mode: AdaptMode,
+    max_candidates: int | None,
+) -> list[Candidate]:
+    target, payload, source_key = target_payload
+    return adapt_candidates(
+        payload,
+        adapter,
+        mode=mode,
+        target=target,
+        source_key=source_key,
+        max_candidates=max_candidates,
+    )
+
+
 def _target_payloads(raw_payload: Any, task: Task) -> Iterator[tuple[Target | None, Any, str | None]]:
     if not isinstance(raw_payload, Mapping):
         if len(task.targets) != 1:
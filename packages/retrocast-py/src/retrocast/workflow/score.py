@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import partial
 from typing import Protocol, cast
 
 from retrocast.exceptions import UnsupportedValidityTierError
@@ -21,6 +22,7 @@ from retrocast.models.evaluation import (
 )
 from retrocast.models.route import InChIKeyLevel, Route
 from retrocast.models.task import Target, Task, TaskConstraint
+from retrocast.utils.parallel import map_in_processes, uses_process_pool
 from retrocast.utils.timing import ExecutionStats
 
 
@@ -90,10 +92,15 @@ def score_target(
     acceptable_route_match: AcceptableRouteMatch = AcceptableRouteMatch.PREFIX,
     wall_time: float | None = None,
     cpu_time: float | None = None,
+    _acceptable_identities: Sequence[AcceptableRouteIdentity] | None = None,
 ) -> TargetResult:
     scored_candidates = []
     route_match_level = acceptable_match_level or InChIKeyLevel.FULL
-    acceptable_identities = _acceptable_route_identities(target.acceptable_routes, route_match_level)
+    acceptable_identities = (
+        _acceptable_identities
+        if _acceptable_identities is not None
+        else _acceptable_route_identities(target.acceptable_routes, route_match_level)
+    )
     for candidate in candidates:
         scored_candidate = score_candidate(
             candidate,
@@ -125,23 +132,44 @@ def score(
     acceptable_match_level: InChIKeyLevel | None = None,
     acceptable_route_match: AcceptableRouteMatch = AcceptableRouteMatch.PREFIX,
     execution_stats: ExecutionStats | None = None,
+    max_workers: int | None = None,
+    acceptable_identities: Mapping[str, Sequence[AcceptableRouteIdentity]] | None = None,
 ) -> Evaluation:
+    """Score every task target; ``max_workers > 1`` scores targets in a process pool.
+
+    Targets are independent, so the parallel path returns the same evaluation as the serial
+    one. Checkers must be picklable to use it. Pass ``acceptable_identities`` from
+    ``acceptable_route_identities`` to reuse acceptable-route signatures across models.
+    """
     tiers = [Tier.ZERO, *sorted({checker.tier for checker in tier_checkers})]
-    target_results = {}
     route_match_level = acceptable_match_level or InChIKeyLevel.FULL
-    for target_id, target in task.targets.items():
-        constraints = task.effective_constraints(target_id)
-        target_results[target_id] = score_target(
-            predictions.get(target_id, []),
+    if acceptable_identities is None:
+        acceptable_identities = acceptable_route_identities(task, route_match_level)
+    jobs = [
+        _TargetScoringJob(
+            candidates=predictions.get(target_id, []),
             target=target,
-            constraints=constraints,
-            tier_checkers=tier_checkers,
-            constraint_checkers=constraint_checkers,
-            acceptable_match_level=route_match_level,
-            acceptable_route_match=acceptable_route_match,
+            constraints=task.effective_constraints(target_id),
+            acceptable_identities=acceptable_identities[target_id],
             wall_time=execution_stats.wall_time.get(target_id) if execution_stats is not None else None,
             cpu_time=execution_stats.cpu_time.get(target_id) if execution_stats is not None else None,
         )
+        for target_id, target in task.targets.items()
+    ]
+    context = _ScoringContext(
+        tier_checkers=tier_checkers,
+        constraint_checkers=constraint_checkers,
+        acceptable_match_level=route_match_level,
+        acceptable_route_match=acceptable_route_match,
+    )
+    if uses_process_pool(max_workers, len(jobs)):
+        # Checkers can hold whole stocks, so they reach each worker once through the initializer rather than per chunk.
+        results = map_in_processes(
+            _score_target_job, jobs, max_workers=max_workers, initializer=_set_scoring_context, initargs=(context,)
+        )
+    else:
+        results = map(partial(_score_target_with_context, context), jobs)
+    target_results = dict(zip(task.targets, results, strict=True))
     return Evaluation(
         task=task,
         tiers=tiers,
@@ -152,6 +180,66 @@ def score(
     )
 
 
+def acceptable_route_identities(
+    task: Task,
+    match_level: InChIKeyLevel = InChIKeyLevel.FULL,
+) -> dict[str, tuple[AcceptableRouteIdentity, ...]]:
+    """Signatures of every target's acceptable routes, computed once per task and match level."""
+    return {
+        target_id: _acceptable_route_identities(target.acceptable_routes, match_level)
+        for target_id, target in task.targets.items()
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class _TargetScoringJob:
+    candidates: Sequence[Candidate]
+    target: Target
+    constraints: Sequence[TaskConstraint]
+    acceptable_identities: Sequence[AcceptableRouteIdentity]
+    wall_time: float | None
+    cpu_time: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class _ScoringContext:
+    tier_checkers: Sequence[TierChecker]
+    constraint_checkers: Sequence[TaskConstraintChecker]
+    acceptable_match_level: InChIKeyLevel
+    acceptable_route_match: AcceptableRouteMatch
+
+
+# Set only inside process-pool workers, by the pool initializer; in-process scoring binds its context explicitly.
+_scoring_context: _ScoringContext | None = None
+
+
+def _set_scoring_context(context: _ScoringContext) -> None:
+    global _scoring_context
+    _scoring_context = context
+
+
+def _score_target_job(job: _TargetScoringJob) -> TargetResult:
+    context = _scoring_context
+    if context is None:
+        raise RuntimeError("scoring context is not initialized")
+    return _score_target_with_context(context, job)
+
+
+def _score_target_with_context(context: _ScoringContext, job: _TargetScoringJob) -> TargetResult:
+    return score_target(
+        job.candidates,
+        target=job.target,
+        constraints=job.constraints,
+        tier_checkers=context.tier_checkers,
+        constraint_checkers=context.constraint_checkers,
+        acceptable_match_level=context.acceptable_match_level,
+        acceptable_route_match=context.acceptable_route_match,
+        wall_time=job.wall_time,
+        cpu_time=job.cpu_time,
+        _acceptable_identities=job.acceptable_identities,
+    )
+
+
 def _tier_zero_validity(candidate: Candidate) -> RouteValidity:
     failure = candidate.failure
     if failure is None:
@@ -198,28 +286,34 @@ def _acceptable_match_index(
     match_level: InChIKeyLevel,
     route_match: AcceptableRouteMatch,
 ) -> int | None:
+    if route_match not in (AcceptableRouteMatch.EXACT, AcceptableRouteMatch.PREFIX):
+        raise ValueError(f"unsupported acceptable route match mode: {route_match}")
+    if not acceptable_identities:
+        return None
+
+    # Matching signatures imply comparable depths, so filter references by depth before hashing.
+    route_depth = route.depth()
     if route_match == AcceptableRouteMatch.EXACT:
+        same_depth = [identity for identity in acceptable_identities if identity.depth == route_depth]
+        if not same_depth:
+            return None
         route_signature = route.signature(match_level)
-        for identity in acceptable_identities:
+        for identity in same_depth:
             if route_signature == identity.signature:
                 return identity.index
         return None
 
-    if route_match == AcceptableRouteMatch.PREFIX:
-        route_depth = route.depth()
-        route_signatures_by_depth: dict[int, str] = {}
-        best: AcceptableRouteIdentity | None = None
-        for identity in acceptable_identities:
-            if route_depth < identity.depth:
-                continue
-            if identity.depth not in route_signatures_by_depth:
-                route_signatures_by_depth[identity.depth] = route.signature(match_level, depth=identity.depth)
-            route_signature = route_signatures_by_depth[identity.depth]
-            if route_signature == identity.signature and (best is None or identity.depth >= best.depth):
-                best = identity
-        return best.index if best is not None else None
-
-    raise ValueError(f"unsupported acceptable route match mode: {route_match}")
+    route_signatures_by_depth: dict[int, str] = {}
+    best: AcceptableRouteIdentity | None = None
+    for identity in acceptable_identities:
+        if route_depth < identity.depth:
+            continue
+        if identity.depth not in route_signatures_by_depth:
+            route_signatures_by_depth[identity.depth] = route.signature(match_level, depth=identity.depth)
+        route_signature = route_signatures_by_depth[identity.depth]
+        if route_signature == identity.signature and (best is None or identity.depth >= best.depth):
+            best = identity
+    return best.index if best is not None else None
 
 
 def _acceptable_route_identities(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import statistics
 from collections.abc import Mapping, Sequence
 
 from pydantic import BaseModel, Field
@@ -33,31 +32,47 @@ class CandidateRunStatistics(BaseModel):
 
     @property
     def avg_candidates_per_target(self) -> float:
-        if not self.candidates_per_target:
-            return 0.0
-        return round(statistics.mean(self.candidates_per_target.values()), 2)
+        return _mean_count(list(self.candidates_per_target.values()))
 
     @property
     def median_candidates_per_target(self) -> float:
-        if not self.candidates_per_target:
-            return 0.0
-        return round(statistics.median(self.candidates_per_target.values()), 2)
+        return _median_count(sorted(self.candidates_per_target.values()))
 
     def to_manifest_dict(self) -> dict[str, object]:
+        # One sorted pass serves all four per-target statistics.
+        counts = sorted(self.candidates_per_target.values())
         return {
             "total_candidates_seen": self.total_candidates_seen,
             "successful_candidates": self.successful_candidates,
             "failed_candidates": self.failed_candidates,
             "final_candidates_saved": self.final_candidates_saved,
             "num_targets_with_at_least_one_candidate": self.num_targets_with_candidates,
-            "min_candidates_per_target": self.min_candidates_per_target,
-            "max_candidates_per_target": self.max_candidates_per_target,
-            "avg_candidates_per_target": self.avg_candidates_per_target,
-            "median_candidates_per_target": self.median_candidates_per_target,
+            "min_candidates_per_target": counts[0] if counts else 0,
+            "max_candidates_per_target": counts[-1] if counts else 0,
+            "avg_candidates_per_target": _mean_count(counts),
+            "median_candidates_per_target": _median_count(counts),
             "failures_by_code": dict(sorted(self.failures_by_code.items())),
         }
 
 
+# Integer arithmetic reproduces statistics.mean/median exactly, including their int results,
+# so persisted manifests are unchanged.
+def _mean_count(counts: list[int]) -> float:
+    if not counts:
+        return 0.0
+    total = sum(counts)
+    return round(total // len(counts) if total % len(counts) == 0 else total / len(counts), 2)
+
+
+def _median_count(sorted_counts: list[int]) -> float:
+    if not sorted_counts:
+        return 0.0
+    midpoint = len(sorted_counts) // 2
+    if len(sorted_counts) % 2:
+        return round(sorted_counts[midpoint], 2)
+    return round((sorted_counts[midpoint - 1] + sorted_counts[midpoint]) / 2, 2)
+
+
 def candidate_statistics(candidates: Sequence[Candidate]) -> CandidateRunStatistics:
     stats = CandidateRunStatistics(total_candidates_seen=len(candidates), final_candidates_saved=len(candidates))
     for candidate in candidates:
@@ -87,25 +102,33 @@ def collected_candidate_statistics(candidates_by_target: Mapping[str, Sequence[C
 
 
 def evaluation_statistics(evaluation: Evaluation) -> dict[str, object]:
-    candidates = [candidate for target in evaluation.targets.values() for candidate in target.candidates]
+    tiers = [Tier(int(tier)) for tier in evaluation.tiers]
+    n_candidates = n_failed_candidates = 0
+    wall_times: list[float] = []
+    cpu_times: list[float] = []
+    n_solv = dict.fromkeys(tiers, 0)
+    for target in evaluation.targets.values():
+        n_candidates += len(target.candidates)
+        n_failed_candidates += sum(1 for candidate in target.candidates if candidate.failed_adaptation())
+        if target.wall_time is not None:
+            wall_times.append(target.wall_time)
+        if target.cpu_time is not None:
+            cpu_times.append(target.cpu_time)
+        for tier in tiers:
+            if any(candidate.satisfies_solv(tier) for candidate in target.candidates):
+                n_solv[tier] += 1
+
     stats: dict[str, object] = {
         "n_targets": len(evaluation.targets),
-        "n_candidates": len(candidates),
-        "n_failed_candidates": sum(1 for candidate in candidates if candidate.failed_adaptation()),
+        "n_candidates": n_candidates,
+        "n_failed_candidates": n_failed_candidates,
     }
-    wall_times = [target.wall_time for target in evaluation.targets.values() if target.wall_time is not None]
-    cpu_times = [target.cpu_time for target in evaluation.targets.values() if target.cpu_time is not None]
     if wall_times:
         stats["total_wall_time_seconds"] = round(sum(wall_times), 6)
         stats["mean_wall_time_seconds"] = round(sum(wall_times) / len(wall_times), 6)
     if cpu_times:
         stats["total_cpu_time_seconds"] = round(sum(cpu_times), 6)
         stats["mean_cpu_time_seconds"] = round(sum(cpu_times) / len(cpu_times), 6)
-    for tier in evaluation.tiers:
-        key = int(tier)
-        stats[f"n_solv_{key}"] = sum(
-            1
-            for target in evaluation.targets.values()
-            if any(candidate.satisfies_solv(Tier(key)) for candidate in target.candidates)
-        )
+    for tier, count in n_solv.items():
+        stats[f"n_solv_{int(tier)}"] = count
     return stats
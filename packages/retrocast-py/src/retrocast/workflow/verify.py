@@ -2,77 +2,148 @@
 Core logic for manifest and data integrity verification using a two-phase audit.
 """
 
+import os
+import re
 from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 from retrocast.io.provenance import calculate_file_hash
-from retrocast.models.provenance import Manifest, VerificationReport
+from retrocast.models.provenance import FileInfo, Manifest, VerificationIssue, VerificationLevel, VerificationReport
+from retrocast.utils.parallel import map_in_threads
 
 # Directories that contain primary artifacts (not generated by the workflow)
-PRIMARY_ARTIFACT_DIRS = {"0-assets", "1-benchmarks", "2-raw", "tmp"}
+PRIMARY_ARTIFACT_DIRS = frozenset({"0-assets", "1-benchmarks", "2-raw", "tmp"})
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
 
 
-def _build_provenance_graph(start_path: Path, root_dir: Path, report: VerificationReport) -> dict[Path, Manifest]:
+class _StatCache:
+    """Existence checks for one verification run, so each candidate path is stat'ed at most once."""
+
+    def __init__(self) -> None:
+        self._exists: dict[Path, bool] = {}
+
+    def exists(self, path: Path) -> bool:
+        if path not in self._exists:
+            try:
+                os.stat(path)
+            except (OSError, ValueError):
+                self._exists[path] = False
+            else:
+                self._exists[path] = True
+        return self._exists[path]
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_source_path(path: str) -> tuple[Path, bool]:
+    """Parse a recorded source path once, returning it with whether it is a primary artifact."""
+    source_path = Path(path)
+    return source_path, not PRIMARY_ARTIFACT_DIRS.isdisjoint(source_path.parts)
+
+
+def _load_manifest(path: Path) -> Manifest:
+    # Pydantic parses UTF-8 bytes directly, skipping the decode to str and its copy.
+    return Manifest.model_validate_json(path.read_bytes())
+
+
+def _load_manifest_or_error(path: Path) -> Manifest | Exception:
+    try:
+        return _load_manifest(path)
+    except Exception as exc:
+        return exc
+
+
+def _build_provenance_graph(
+    start_path: Path,
+    root_dir: Path,
+    report: VerificationReport,
+    stats: _StatCache | None = None,
+    max_workers: int | None = None,
+    record_info: bool = True,
+) -> dict[Path, Manifest]:
     """Recursively discover and load all manifests in the dependency graph."""
+    stats = stats or _StatCache()
     graph: dict[Path, Manifest] = {}
     queue = deque([start_path])
     visited: set[Path] = set()
 
-    report.add("INFO", start_path, "Graph Discovery", category="header")
+    if record_info:
+        report.add("INFO", start_path, "Graph Discovery", category="header")
 
     while queue:
-        manifest_path = queue.popleft()
-        resolved_manifest_path = _resolve_tracked_path(manifest_path, root_dir)
-        if resolved_manifest_path in visited:
-            continue
-        visited.add(resolved_manifest_path)
+        # Everything queued so far is one BFS level: read its manifests together, then walk them in queue order.
+        level = [(manifest_path, _resolve_tracked_path(manifest_path, root_dir, stats)) for manifest_path in queue]
+        queue.clear()
+        load_paths = [
+            path
+            for path in dict.fromkeys(resolved for _, resolved in level)
+            if path not in visited and stats.exists(path)
+        ]
+        loaded = dict(
+            zip(load_paths, map_in_threads(_load_manifest_or_error, load_paths, max_workers=max_workers), strict=True)
+        )
 
-        relative_path = _tracked_path_key(manifest_path, root_dir)
-        if not resolved_manifest_path.exists():
-            report.add("FAIL", relative_path, "Manifest file in dependency chain is MISSING.", category="graph")
-            continue
+        for manifest_path, resolved_manifest_path in level:
+            if resolved_manifest_path in visited:
+                continue
+            visited.add(resolved_manifest_path)
 
-        try:
-            with open(resolved_manifest_path, encoding="utf-8") as f:
-                manifest = Manifest.model_validate_json(f.read())
-            graph[relative_path] = manifest
-            report.add("PASS", relative_path, f"Loaded manifest for action '{manifest.action}'.", category="graph")
-
-            for source_file in manifest.source_files:
-                source_path = Path(source_file.path)
-                is_primary = any(part in PRIMARY_ARTIFACT_DIRS for part in source_path.parts)
-                if not is_primary:
-                    parent_manifest_path = _resolve_tracked_path(source_path.parent / "manifest.json", root_dir)
-                    if parent_manifest_path not in visited:
-                        report.add(
-                            "INFO",
-                            source_path,
-                            "Source is a generated artifact, adding its manifest to the queue.",
-                            category="graph",
+            relative_path = _tracked_path_key(manifest_path, root_dir, stats)
+            if not stats.exists(resolved_manifest_path):
+                report.add("FAIL", relative_path, "Manifest file in dependency chain is MISSING.", category="graph")
+                continue
+
+            try:
+                manifest = loaded[resolved_manifest_path]
+                if isinstance(manifest, Exception):
+                    raise manifest
+                graph[relative_path] = manifest
+                report.add("PASS", relative_path, f"Loaded manifest for action '{manifest.action}'.", category="graph")
+
+                for source_file in manifest.source_files:
+                    source_path, is_primary = _parse_source_path(source_file.path)
+                    if not is_primary:
+                        parent_manifest_path = _resolve_tracked_path(
+                            source_path.parent / "manifest.json", root_dir, stats
                         )
-                        queue.append(parent_manifest_path)
-        except Exception as e:
-            report.add("FAIL", relative_path, f"Failed to load or parse manifest: {e}", category="graph")
+                        if parent_manifest_path not in visited:
+                            if record_info:
+                                report.add(
+                                    "INFO",
+                                    source_path,
+                                    "Source is a generated artifact, adding its manifest to the queue.",
+                                    category="graph",
+                                )
+                            queue.append(parent_manifest_path)
+            except Exception as e:
+                report.add("FAIL", relative_path, f"Failed to load or parse manifest: {e}", category="graph")
 
     return graph
 
 
 def _verify_logical_chain(
-    graph: dict[Path, Manifest], report: VerificationReport, root_dir: Path | None = None
+    graph: dict[Path, Manifest],
+    report: VerificationReport,
+    root_dir: Path | None = None,
+    stats: _StatCache | None = None,
+    record_info: bool = True,
 ) -> None:
     """Phase 1: Check for hash consistency between parent and child manifests."""
-    report.add("INFO", report.manifest_path, "Phase 1 - Verifying manifest chain consistency", category="header")
+    if record_info:
+        report.add("INFO", report.manifest_path, "Phase 1 - Verifying manifest chain consistency", category="header")
+    # Parent outputs indexed by recorded path, built the first time a parent is linked to.
+    outputs_by_path: dict[Path, dict[str, FileInfo]] = {}
 
     for child_path, child_manifest in graph.items():
-        report.add(
-            "INFO", child_path, f"Inspecting links for manifest '{child_manifest.action}'...", category="context"
-        )
+        if record_info:
+            report.add(
+                "INFO", child_path, f"Inspecting links for manifest '{child_manifest.action}'...", category="context"
+            )
         if not child_manifest.source_files:
             continue
 
         for source_file in child_manifest.source_files:
-            source_path = Path(source_file.path)
-            is_primary = any(part in PRIMARY_ARTIFACT_DIRS for part in source_path.parts)
+            source_path, is_primary = _parse_source_path(source_file.path)
 
             if is_primary:
                 # This is just a statement of fact, no promise.
@@ -81,7 +152,7 @@ def _verify_logical_chain(
 
             parent_manifest_path = source_path.parent / "manifest.json"
             if root_dir is not None:
-                parent_manifest_path = _tracked_path_key(parent_manifest_path, root_dir)
+                parent_manifest_path = _tracked_path_key(parent_manifest_path, root_dir, stats)
             if parent_manifest_path not in graph:
                 report.add(
                     "WARN",
@@ -92,9 +163,12 @@ def _verify_logical_chain(
                 continue
 
             parent_manifest = graph[parent_manifest_path]
-            parent_output_info = next(
-                (out for out in parent_manifest.iter_output_files() if out.path == source_file.path), None
-            )
+            if parent_manifest_path not in outputs_by_path:
+                # Reversed so the first declaration of a path wins, as a linear scan would find it.
+                outputs_by_path[parent_manifest_path] = {
+                    out.path: out for out in reversed(parent_manifest.iter_output_files())
+                }
+            parent_output_info = outputs_by_path[parent_manifest_path].get(source_file.path)
 
             if not parent_output_info:
                 report.add(
@@ -125,50 +199,93 @@ def _verify_physical_integrity(
     report: VerificationReport,
     output_only: bool = False,
     lenient: bool = True,
+    max_workers: int | None = None,
+    stats: _StatCache | None = None,
+    hash_cache: dict[Path, str] | None = None,
+    record_info: bool = True,
 ) -> None:
     """Phase 2: Verify ALL files mentioned in the graph against the disk."""
-    report.add("INFO", report.manifest_path, "Phase 2 - Verifying on-disk file integrity", category="header")
+    stats = stats or _StatCache()
+    hash_cache = {} if hash_cache is None else hash_cache
+    if record_info:
+        report.add("INFO", report.manifest_path, "Phase 2 - Verifying on-disk file integrity", category="header")
 
     # 1. Build a canonical map of every file to its expected hash.
     # Outputs are the source of truth; sources are secondary.
-    expected_hashes: dict[Path, str] = {}
-    for manifest in graph.values():
-        for f in manifest.iter_output_files():
-            expected_hashes[Path(f.path)] = f.file_hash
-
-    # Only check source files if not in output_only mode
-    if not output_only:
-        for manifest in graph.values():
-            for f in manifest.source_files:
-                path = Path(f.path)
-                if path not in expected_hashes:  # Only add if it's not a generated output
-                    expected_hashes[path] = f.file_hash
-
-    # 2. Iterate and check every file against the disk.
-    for relative_path, expected_hash in sorted(expected_hashes.items()):
-        absolute_path = _resolve_tracked_path(relative_path, root_dir)
-
-        if not absolute_path.exists():
+    output_hashes = {Path(f.path): f.file_hash for manifest in graph.values() for f in manifest.iter_output_files()}
+    # Only check source files if not in output_only mode. Walking in reverse keeps the first record of each source.
+    source_hashes = (
+        {}
+        if output_only
+        else {
+            _parse_source_path(f.path)[0]: f.file_hash
+            for manifest in reversed(graph.values())
+            for f in reversed(manifest.source_files)
+        }
+    )
+    expected_hashes = source_hashes | output_hashes
+
+    # 2. Hash every file present on disk, fanning out across threads when asked (hashlib releases the GIL).
+    checks = [
+        (relative_path, expected_hash, _resolve_tracked_path(relative_path, root_dir, stats))
+        for relative_path, expected_hash in sorted(expected_hashes.items())
+    ]
+    present_paths = {absolute_path for _, _, absolute_path in checks if stats.exists(absolute_path)}
+    # Recorded placeholders such as "file-not-written" can never equal a digest, so those files are not read.
+    # Files already hashed by an earlier verification sharing ``hash_cache`` are not read again.
+    hash_paths = list(
+        dict.fromkeys(
+            absolute_path
+            for _, expected_hash, absolute_path in checks
+            if absolute_path in present_paths
+            and absolute_path not in hash_cache
+            and _SHA256_HEX.fullmatch(expected_hash)
+        )
+    )
+    actual_hashes = dict(
+        zip(hash_paths, map_in_threads(_hash_or_error, hash_paths, max_workers=max_workers), strict=True)
+    )
+    hash_cache.update((path, digest) for path, digest in actual_hashes.items() if isinstance(digest, str))
+
+    # 3. Check every file against the disk, recording the results in one batch.
+    entries: list[tuple[VerificationLevel, Path, str]] = []
+    for relative_path, expected_hash, absolute_path in checks:
+        if absolute_path not in present_paths:
             # In lenient mode (default), missing files are warnings (expected for partial downloads)
             # In strict mode, missing files are failures (required for complete verification)
-            level = "WARN" if lenient else "FAIL"
-            report.add(level, relative_path, "File is MISSING from disk.", category="phase2")
+            entries.append(("WARN" if lenient else "FAIL", relative_path, "File is MISSING from disk."))
             continue
 
-        try:
-            actual_hash = calculate_file_hash(absolute_path)
-        except OSError as exc:
-            report.add("FAIL", relative_path, f"Could not hash file: {exc}", category="phase2")
-            continue
-        if actual_hash != expected_hash:
+        actual_hash = actual_hashes.get(absolute_path, hash_cache.get(absolute_path))
+        if isinstance(actual_hash, OSError):
+            entries.append(("FAIL", relative_path, f"Could not hash file: {actual_hash}"))
+        elif actual_hash != expected_hash:
             # Hash mismatches are ALWAYS failures - indicates corruption
-            report.add("FAIL", relative_path, "HASH MISMATCH (Disk vs. Manifest).", category="phase2")
+            entries.append(("FAIL", relative_path, "HASH MISMATCH (Disk vs. Manifest)."))
         else:
-            report.add("PASS", relative_path, "On-disk file hash matches manifest record.", category="phase2")
+            entries.append(("PASS", relative_path, "On-disk file hash matches manifest record."))
+    report.extend(
+        VerificationIssue(level=level, path=path, message=message, category="phase2")
+        for level, path, message in entries
+    )
+
+
+def _hash_or_error(path: Path) -> str | OSError:
+    try:
+        return calculate_file_hash(path)
+    except OSError as exc:
+        return exc
 
 
 def verify_manifest(
-    manifest_path: Path, root_dir: Path, deep: bool = False, output_only: bool = False, lenient: bool = True
+    manifest_path: Path,
+    root_dir: Path,
+    deep: bool = False,
+    output_only: bool = False,
+    lenient: bool = True,
+    max_workers: int | None = None,
+    hash_cache: dict[Path, str] | None = None,
+    include_info: bool = True,
 ) -> VerificationReport:
     """
     Verifies the integrity and lineage of an artifact via its manifest.
@@ -179,17 +296,29 @@ def verify_manifest(
         deep: If True, performs deep verification of entire dependency chain
         output_only: If True, only verifies output files (skips input file hash checks)
         lenient: If True (default), missing files are warnings; if False, missing files are failures
+        max_workers: Number of threads used to load manifests and hash files (default: serially)
+        hash_cache: Absolute path -> SHA-256 digests shared between calls, so files referenced by
+            several manifests are hashed once. Only pass one while the files cannot change.
+        include_info: If False, INFO entries (headers, progress notes) are never built or recorded
     """
-    report = VerificationReport(manifest_path=_tracked_path_key(manifest_path, root_dir))
+    stats = _StatCache()
+    report = VerificationReport(manifest_path=_tracked_path_key(manifest_path, root_dir, stats))
 
     if not deep:
         # Perform a simple, shallow verification if not deep
         try:
-            with open(_resolve_tracked_path(manifest_path, root_dir), encoding="utf-8") as f:
-                manifest = Manifest.model_validate_json(f.read())
+            manifest = _load_manifest(_resolve_tracked_path(manifest_path, root_dir, stats))
             # A shallow check is just phase 2 on a single manifest
             _verify_physical_integrity(
-                {report.manifest_path: manifest}, root_dir, report, output_only=output_only, lenient=lenient
+                {report.manifest_path: manifest},
+                root_dir,
+                report,
+                output_only=output_only,
+                lenient=lenient,
+                max_workers=max_workers,
+                stats=stats,
+                hash_cache=hash_cache,
+                record_info=include_info,
             )
         except Exception as e:
             report.add("FAIL", report.manifest_path, f"Failed to load manifest: {e}", category="phase2")
@@ -198,7 +327,9 @@ def verify_manifest(
     # --- Deep Verification Starts Here ---
 
     # 1. Build the full dependency graph of all manifests.
-    provenance_graph = _build_provenance_graph(manifest_path, root_dir, report)
+    provenance_graph = _build_provenance_graph(
+        manifest_path, root_dir, report, stats, max_workers=max_workers, record_info=include_info
+    )
     if not report.is_valid:
         report.add("FAIL", report.manifest_path, "Could not build provenance graph, aborting.", category="graph")
         return report
@@ -210,7 +341,7 @@ def verify_manifest(
     )
 
     # 2. Phase 1: Verify the logical consistency of the entire graph.
-    _verify_logical_chain(provenance_graph, report, root_dir=root_dir)
+    _verify_logical_chain(provenance_graph, report, root_dir=root_dir, stats=stats, record_info=include_info)
     if not report.is_valid:
         report.add(
             "FAIL",
@@ -221,26 +352,37 @@ def verify_manifest(
         return report
 
     # 3. Phase 2: Verify the physical integrity of all files in the graph.
-    _verify_physical_integrity(provenance_graph, root_dir, report, output_only=output_only, lenient=lenient)
+    _verify_physical_integrity(
+        provenance_graph,
+        root_dir,
+        report,
+        output_only=output_only,
+        lenient=lenient,
+        max_workers=max_workers,
+        stats=stats,
+        hash_cache=hash_cache,
+        record_info=include_info,
+    )
 
     return report
 
 
-def _resolve_tracked_path(path: Path, root_dir: Path) -> Path:
+def _resolve_tracked_path(path: Path, root_dir: Path, stats: _StatCache | None = None) -> Path:
     if path.is_absolute():
         return path
 
+    exists = stats.exists if stats is not None else Path.exists
     candidates = [root_dir / path]
     candidates.extend(parent / path for parent in root_dir.parents)
     candidates.append(Path.cwd() / path)
     for candidate in candidates:
-        if candidate.exists():
+        if exists(candidate):
             return candidate
     return candidates[0]
 
 
-def _tracked_path_key(path: Path, root_dir: Path) -> Path:
-    resolved = _resolve_tracked_path(path, root_dir)
+def _tracked_path_key(path: Path, root_dir: Path, stats: _StatCache | None = None) -> Path:
+    resolved = _resolve_tracked_path(path, root_dir, stats)
     try:
         return resolved.relative_to(root_dir.resolve())
     except ValueError:
@@ -116,3 +116,13 @@ def test_dms_calculates_route_length() -> None:
     tree = DMSTree.model_validate({"smiles": "CCO", "children": [{"smiles": "CC", "children": [{"smiles": "C"}]}]})
 
     assert DirectMultiStepAdapter.calculate_route_length(tree) == 2
+
+
+@pytest.mark.contract
+def test_dms_route_length_takes_the_longest_branch_of_a_deep_tree() -> None:
+    chain = DMSTree(smiles="C")
+    for _ in range(3000):
+        chain = DMSTree(smiles="C", children=[chain])
+    tree = DMSTree(smiles="CC", children=[DMSTree(smiles="O"), chain])
+
+    assert DirectMultiStepAdapter.calculate_route_length(tree) == 3001
@@ -89,6 +89,15 @@ def test_synllama_rejects_reaction_without_reactants() -> None:
     assert exc_info.value.code == "adapter.route_string_invalid"
 
 
+@pytest.mark.contract
+def test_synllama_parses_chained_steps_and_prunes_invalid_products() -> None:
+    adapter = SynLlamaAdapter()
+
+    assert adapter._parse_synthesis_string("C;O;R1;CO;N;R2;CON") == {"CO": ["C", "O"], "CON": ["N", "CO"]}
+    # An unparseable product drops its step and the chain restarts from the following reactants.
+    assert adapter._parse_synthesis_string("C;R1;X(;N;R2;CN", mode="prune") == {"CN": ["N"]}
+
+
 @pytest.mark.contract
 def test_synllama_rejects_non_list_payload() -> None:
     with pytest.raises(AdapterSchemaError) as exc_info:
@@ -140,3 +149,15 @@ def test_synllama_prune_does_not_carry_over_product_after_failure() -> None:
 def test_synllama_allows_duplicate_leaf_molecules() -> None:
     route = SynLlamaAdapter().cast({"synthesis_string": "C;C;R1;CCO"}, target=target_for("CCO"))
     assert [reactant.value.smiles for reactant in route.reaction_at("rc:r:/").reactants()] == ["C", "C"]
+
+
+@pytest.mark.unit
+def test_synllama_routes_share_one_string_per_building_block() -> None:
+    adapter = SynLlamaAdapter()
+    first = adapter.cast({"synthesis_string": "C;CC;R1;CCO"}, target=target_for("CCO"))
+    second = adapter.cast({"synthesis_string": "CC;C;R1;CCO"}, target=target_for("CCO"))
+
+    first_leaves = {reactant.value.smiles: reactant.value for reactant in first.reaction_at("rc:r:/").reactants()}
+    for reactant in second.reaction_at("rc:r:/").reactants():
+        assert reactant.value.smiles is first_leaves[reactant.value.smiles].smiles
+        assert reactant.value.inchikey is first_leaves[reactant.value.smiles].inchikey
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import csv
 import gzip
 import hashlib
@@ -11,6 +12,7 @@ import pytest
 
 from retrocast.adapters import PaRoutesAdapter
 from retrocast.chem import canonicalize_smiles, get_inchi_key
+from retrocast.cli import main as cli_main
 from retrocast.cli.main import _resolve_training_data_artifact_and_release, main
 from retrocast.exceptions import ConfigurationError
 from retrocast.io import (
@@ -221,6 +223,25 @@ def test_v2_list_cli_reports_raw_manifests(tmp_path, monkeypatch, capsys) -> Non
     assert "paroutes" in output
 
 
+def test_v2_list_cli_parses_each_manifest_once(tmp_path, monkeypatch, capsys) -> None:
+    data_dir = tmp_path / "data"
+    write_raw_job(data_dir, model="model-a", dataset="small")
+    write_raw_job(data_dir, model="model-b", dataset="small")
+    parsed: list[Path] = []
+    original = cli_main._manifest_directives
+
+    def counting_directives(path: Path) -> dict:
+        parsed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(cli_main, "_manifest_directives", counting_directives)
+    run_cli(monkeypatch, "--data-dir", str(data_dir), "list")
+
+    output = capsys.readouterr().out
+    assert "results.json.gz" in output
+    assert sorted(path.parent.parent.name for path in parsed) == ["model-a", "model-b"]
+
+
 def test_v2_compare_pareto_frontier_uses_analysis_reports(tmp_path, monkeypatch) -> None:
     data_dir = tmp_path / "data"
     for model_name, value in [("model-a", 0.75), ("model-b", 0.5)]:
@@ -322,6 +343,34 @@ def test_v2_collect_cli_writes_collected_candidates_and_manifest(tmp_path, monke
     assert manifest["action"] == "[cli]collect"
 
 
+def test_text_stock_loader_strips_and_dedupes_smiles(tmp_path, monkeypatch) -> None:
+    stock_path = tmp_path / "stock.txt"
+    stock_path.write_text("CCO\n  CCO \n\nC\n", encoding="utf-8")
+    seen: list[str] = []
+
+    def counting_inchi_key(smiles: str) -> str:
+        seen.append(smiles)
+        return get_inchi_key(smiles)
+
+    monkeypatch.setattr(cli_main, "get_inchi_key", counting_inchi_key)
+
+    assert cli_main._load_stock_path(stock_path) == {get_inchi_key("CCO"), get_inchi_key("C")}
+    assert seen == ["CCO", "C"]
+
+
+def test_verify_all_finds_manifests_at_every_depth(tmp_path) -> None:
+    nested = tmp_path / "3-processed" / "small" / "model-a"
+    nested.mkdir(parents=True)
+    for directory in (tmp_path, nested):
+        (directory / "manifest.json").write_text("{}", encoding="utf-8")
+    (nested / "candidates.manifest.json").write_text("{}", encoding="utf-8")
+
+    paths = cli_main._resolve_manifest_paths(argparse.Namespace(all=True), tmp_path)
+
+    assert paths == sorted(tmp_path.glob("**/manifest.json"))
+    assert paths == [tmp_path / "3-processed" / "small" / "model-a" / "manifest.json", tmp_path / "manifest.json"]
+
+
 def test_v2_project_cli_ingest_score_analyze(tmp_path, monkeypatch) -> None:
     data_dir = tmp_path / "data"
     (data_dir / "1-benchmarks" / "definitions").mkdir(parents=True)
@@ -407,6 +456,31 @@ def test_v2_ingest_cli_discovers_all_models_and_datasets(tmp_path, monkeypatch)
     assert (data_dir / "3-processed" / "small" / "model-b" / "candidates.json.gz").exists()
 
 
+def test_v2_score_cli_loads_each_benchmark_once_for_all_models(tmp_path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    (data_dir / "1-benchmarks" / "definitions").mkdir(parents=True)
+    write_stock(data_dir / "1-benchmarks" / "stocks" / "test-stock.csv.gz")
+    save_benchmark(benchmark(), data_dir / "1-benchmarks" / "definitions" / "small.json.gz")
+    write_raw_job(data_dir, model="model-a", dataset="small")
+    write_raw_job(data_dir, model="model-b", dataset="small")
+    run_cli(monkeypatch, "--data-dir", str(data_dir), "ingest", "--all-models", "--all-datasets", "--no-progress")
+    loaded_benchmarks = []
+    load_benchmark = cli_main.load_benchmark
+
+    def counting_load_benchmark(path):
+        loaded_benchmarks.append(path)
+        return load_benchmark(path)
+
+    monkeypatch.setattr(cli_main, "load_benchmark", counting_load_benchmark)
+
+    run_cli(monkeypatch, "--data-dir", str(data_dir), "score", "--all-models", "--all-datasets")
+
+    assert len(loaded_benchmarks) == 1
+    for model in ("model-a", "model-b"):
+        evaluation_path = data_dir / "4-scored" / "small" / model / "test-stock" / "evaluation.json.gz"
+        assert load_evaluation(evaluation_path).targets["ethanol"].candidates[0].satisfies_task()
+
+
 def load_candidates_from_raw(raw: dict) -> list[Candidate]:
     return adapt_candidates({"ethanol": raw}, PaRoutesAdapter(), target=benchmark().targets["ethanol"])
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+import yaml
 
 from retrocast.cli.compare import (
     ParetoPoint,
@@ -11,6 +12,7 @@ from retrocast.cli.compare import (
     _load_config,
     _load_points,
     _model_x_value,
+    _point_traces,
     _resolve_analysis_path,
     _resolve_output_dir,
     _x_axis_title,
@@ -39,6 +41,17 @@ def test_compare_config_defaults_and_validation_errors(tmp_path: Path) -> None:
     assert shape_error.value.code == "config.invalid_shape"
 
 
+@pytest.mark.unit
+def test_compare_config_loader_matches_safe_load(tmp_path: Path) -> None:
+    config = tmp_path / "compare.yaml"
+    config.write_text(
+        "stock: n5\ntop_k: 3\nno_open: yes\nrelease: 2026-05-12\nmodels:\n  - {name: a, color: '#fff'}\n",
+        encoding="utf-8",
+    )
+
+    assert _load_config(config) == yaml.safe_load(config.read_text(encoding="utf-8"))
+
+
 @pytest.mark.contract
 def test_compare_load_points_validates_source_and_model_shapes(tmp_path: Path) -> None:
     report_path = tmp_path / "analysis.json.gz"
@@ -132,3 +145,20 @@ def test_compare_group_lines_connect_points_in_same_group() -> None:
             "hoverinfo": "skip",
         }
     ]
+
+
+@pytest.mark.contract
+def test_compare_point_traces_share_one_trace_per_legend_entry() -> None:
+    points = [
+        ParetoPoint("a-fast", "A", "a1", "red", 1.0, MetricSummary(value=0.2, count=3)),
+        ParetoPoint("b", "B", "b", "blue", 2.0, MetricSummary(value=0.4, count=4)),
+        ParetoPoint("a-slow", "A", "a2", "red", 3.0, MetricSummary(value=0.6, count=5)),
+    ]
+
+    traces = _point_traces(points, metric_name="metric", time_based=False)
+
+    assert [trace["name"] for trace in traces] == ["A", "B"]
+    assert traces[0]["x"] == [1.0, 3.0]
+    assert traces[0]["y"] == [0.2, 0.6]
+    assert traces[0]["text"] == ["a1", "a2"]
+    assert [row[:2] for row in traces[0]["customdata"]] == [["a-fast", 3], ["a-slow", 5]]
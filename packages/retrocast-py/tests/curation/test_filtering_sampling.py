@@ -31,6 +31,16 @@ def test_deduplicate_routes_uses_route_signature() -> None:
     assert deduplicate_routes([route, route.model_copy(deep=True)]) == [route]
 
 
+def test_deduplicate_routes_skips_identity_for_fewer_than_two_routes() -> None:
+    def unexpected_key(route: Route) -> str:
+        raise AssertionError("identity should not be computed")
+
+    route = linear_route()
+
+    assert deduplicate_routes([], key=unexpected_key) == []
+    assert deduplicate_routes([route], key=unexpected_key) == [route]
+
+
 def test_filter_by_route_type_uses_primary_acceptable_route() -> None:
     linear_target = target("linear", "CCO", linear_route())
     convergent_target = target("convergent", "CCN", convergent_route())
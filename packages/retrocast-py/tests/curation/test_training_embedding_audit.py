@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import pytest
 
-from retrocast.curation.training.embedding_audit import RouteEmbeddingAudit, build_route_embedding_audit
+from retrocast.curation.training.embedding_audit import (
+    RouteEmbeddingAudit,
+    _subtree_depths,
+    build_route_embedding_audit,
+)
 from retrocast.curation.training.embedding_report import render_route_embedding_audit_markdown
 from retrocast.curation.training.records import TrainingRouteRecord
 from retrocast.models.route import Molecule, Reaction, Route
@@ -149,6 +153,18 @@ def test_route_embedding_audit_rejects_exclusion_with_duplicate_container_ids()
         )
 
 
+@pytest.mark.unit
+def test_subtree_depths_match_each_molecule_depth() -> None:
+    branch = molecule("b", KEY_B, reactants=[molecule("a", KEY_A, reactants=[])])
+    route = Route(target=molecule("d", KEY_D, reactants=[route_c_b_a().target, branch, molecule("a", KEY_A)]))
+    molecules = list(route.iter_molecules())
+
+    depths = _subtree_depths(molecules)
+
+    assert [depths[id(item.value)] for item in molecules] == [item.depth() for item in molecules]
+    assert depths[id(route.target)] == 3
+
+
 def sample_full_match_audit() -> RouteEmbeddingAudit:
     container = route_record("container", route_c_b_a())
     queries = {
@@ -29,6 +29,7 @@ from retrocast.curation.training.records import (
     TrainingReactionSource,
     TrainingRouteRecord,
     TrainingSetBuildConfig,
+    group_records_by_split,
 )
 from retrocast.curation.training.route_release import (
     TrainingRouteReleaseBuilder,
@@ -110,6 +111,19 @@ def test_route_summary_depth_counts_are_sorted_numerically() -> None:
     assert summary["by_depth"] == {"2": 2, "3": 1, "10": 1}
 
 
+def test_group_records_by_split_keeps_record_order_within_each_split() -> None:
+    records = [
+        route_record(name, linear_route(depth=2), split=split)
+        for name, split in [("a", "validation"), ("b", "training"), ("c", "validation")]
+    ]
+
+    grouped = group_records_by_split(records)
+
+    assert [record.id for record in grouped["training"]] == ["route-b"]
+    assert [record.id for record in grouped["validation"]] == ["route-a", "route-c"]
+    assert summarize_records(records)["all_records"] == {"total": 3, "training": 1, "validation": 2}
+
+
 def test_route_release_collapses_mapped_variants_and_preserves_sources() -> None:
     route_a = one_step_route("C.C>>CC", patent_id="patent-a")
     route_b = one_step_route("[CH3:1].[CH3:2]>>[CH3:1][CH3:2]", patent_id="patent-b")
@@ -114,3 +114,47 @@ def test_local_cache_ignores_non_mapping_manifest(tmp_path: Path, monkeypatch: p
 
     assert first == CachedValue(name="same", count=1)
     assert compute() == CachedValue(name="same", count=2)
+
+
+@pytest.mark.integration
+def test_local_cache_refresh_cache_recomputes_and_overwrites(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
+    calls = 0
+
+    @local_cache(
+        namespace="test-values",
+        key=lambda value: {"value": value},
+        codec=json_type_cache(CachedValue),
+    )
+    def compute(value: str) -> CachedValue:
+        nonlocal calls
+        calls += 1
+        return CachedValue(name=value, count=calls)
+
+    assert compute("same") == CachedValue(name="same", count=1)
+    assert compute("same", refresh_cache=True) == CachedValue(name="same", count=2)
+    assert compute("same") == CachedValue(name="same", count=2)
+    assert calls == 2
+
+
+@pytest.mark.integration
+def test_local_cache_returns_computed_value_when_cache_is_unwritable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_file = tmp_path / "cache"
+    cache_file.write_text("not a directory", encoding="utf-8")
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(cache_file))
+    calls = 0
+
+    @local_cache(
+        namespace="test-values",
+        key=lambda value: {"value": value},
+        codec=json_type_cache(CachedValue),
+    )
+    def compute(value: str) -> CachedValue:
+        nonlocal calls
+        calls += 1
+        return CachedValue(name=value, count=calls)
+
+    assert compute("same") == CachedValue(name="same", count=1)
+    assert compute("same") == CachedValue(name="same", count=2)
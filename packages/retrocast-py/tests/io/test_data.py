@@ -4,9 +4,11 @@ import gzip
 from typing import Literal
 
 import pytest
+from pydantic import TypeAdapter
 
 from retrocast.chem import canonicalize_smiles, get_inchi_key
 from retrocast.exceptions import ArtifactDecodeError, ArtifactFormatError, ArtifactNotFoundError, ArtifactWriteError
+from retrocast.io import data as data_module
 from retrocast.io import (
     load_benchmark,
     load_candidates,
@@ -27,6 +29,7 @@ from retrocast.io import (
     save_evaluation,
     save_execution_stats,
     save_json_gz,
+    save_json_object_gz,
     save_jsonl_gz,
     save_lines_gz,
     save_routes,
@@ -175,10 +178,20 @@ def test_load_stock_file_reads_columns_and_rejects_bad_inputs(tmp_path) -> None:
         load_stock_file(corrupt)
 
 
+def test_load_stock_file_skips_blank_and_short_rows(tmp_path) -> None:
+    path = tmp_path / "ragged.csv.gz"
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as handle:
+        handle.write("SMILES,InChIKey\nC, KEY-A \n\nCO\nCCO,\nCCC,KEY-B,extra\n")
+
+    assert load_stock_file(path) == {"KEY-A", "KEY-B"}
+    assert load_stock_file(path, return_as="smiles") == {"C", "CO", "CCO", "CCC"}
+
+
 @pytest.mark.parametrize(
     ("writer", "rows", "filename"),
     [
         (save_jsonl_gz, [{"row": 1}], "rows.jsonl.gz"),
+        (save_json_object_gz, [("row", 1)], "object.json.gz"),
         (save_lines_gz, ["line"], "lines.txt.gz"),
         (save_csv_gz, [["cell"]], "rows.csv.gz"),
     ],
@@ -227,6 +240,24 @@ def test_collected_candidates_round_trip(tmp_path) -> None:
     assert load_collected_candidates(path) == value
 
 
+def test_collected_candidates_stream_the_same_bytes_as_a_whole_document(tmp_path) -> None:
+    value = {
+        "ethanol": [Candidate(rank=1, route=route())],
+        "methanol": [],
+        "propanol": [Candidate(rank=1, failure=FailureRecord(code=ErrorCode("adapter.schema_invalid")))],
+    }
+    payload = TypeAdapter(dict[str, list[Candidate]]).dump_python(
+        value, mode="json", exclude_none=True, exclude_computed_fields=True
+    )
+
+    save_collected_candidates(value, tmp_path / "streamed.json.gz")
+    save_json_gz(payload, tmp_path / "whole.json.gz")
+    save_collected_candidates({}, tmp_path / "empty.json.gz")
+
+    assert (tmp_path / "streamed.json.gz").read_bytes() == (tmp_path / "whole.json.gz").read_bytes()
+    assert load_collected_candidates(tmp_path / "empty.json.gz") == {}
+
+
 def test_route_candidate_evaluation_analysis_and_execution_artifacts_round_trip(tmp_path) -> None:
     routes_path = tmp_path / "routes.json.gz"
     candidates_path = tmp_path / "candidates.json.gz"
@@ -253,7 +284,8 @@ def test_route_candidate_evaluation_analysis_and_execution_artifacts_round_trip(
     assert load_execution_stats(execution_path) == execution
 
 
-def test_benchmark_results_loader_exposes_evaluation_sequence_and_statistics(tmp_path) -> None:
+def test_benchmark_results_loader_exposes_evaluation_sequence_and_statistics(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
     data_dir = tmp_path / "retrocast"
     evaluation_path = data_dir / "4-scored" / "small" / "model-a" / "stock-a" / "evaluation.json.gz"
     evaluation = scored_evaluation()
@@ -276,7 +308,8 @@ def test_benchmark_results_loader_exposes_evaluation_sequence_and_statistics(tmp
     assert stats[0].top_k_accuracy[1].by_stratum["depth 1"].count == 1
 
 
-def test_benchmark_results_loader_keeps_named_route_depth_strata(tmp_path) -> None:
+def test_benchmark_results_loader_keeps_named_route_depth_strata(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
     data_dir = tmp_path / "retrocast"
     evaluation_path = data_dir / "4-scored" / "small" / "model-a" / "stock-a" / "evaluation.json.gz"
     save_evaluation(scored_evaluation(route_depth="short"), evaluation_path)
@@ -286,6 +319,80 @@ def test_benchmark_results_loader_keeps_named_route_depth_strata(tmp_path) -> No
     assert stats[0].top_k_accuracy[1].by_stratum["depth short"].count == 1
 
 
+def test_benchmark_results_loader_replays_cached_statistics(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "retrocast"
+    evaluation_path = data_dir / "4-scored" / "small" / "model-a" / "stock-a" / "evaluation.json.gz"
+    save_evaluation(scored_evaluation(), evaluation_path)
+    loader = BenchmarkResultsLoader(tmp_path)
+    calls = 0
+    compute_metrics_with_ci = data_module.compute_metrics_with_ci
+
+    def counting_compute(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return compute_metrics_with_ci(*args, **kwargs)
+
+    monkeypatch.setattr(data_module, "compute_metrics_with_ci", counting_compute)
+
+    first = loader.load_statistics("small", ["model-a"], "stock-a")
+    computed_calls = calls
+    second = loader.load_statistics("small", ["model-a"], "stock-a")
+
+    assert computed_calls > 0
+    assert calls == computed_calls
+    assert second[0].top_k_accuracy == first[0].top_k_accuracy
+    assert second[0].stock_termination == first[0].stock_termination
+
+    loader.load_statistics("small", ["model-a"], "stock-a", force_recompute=True)
+
+    assert calls == 2 * computed_calls
+
+
+def test_benchmark_results_loader_replays_cached_statistics_without_decoding_evaluation(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
+    save_evaluation(
+        scored_evaluation(),
+        tmp_path / "retrocast" / "4-scored" / "small" / "model-a" / "stock-a" / "evaluation.json.gz",
+    )
+    loader = BenchmarkResultsLoader(tmp_path)
+    first = loader.load_statistics("small", ["model-a"], "stock-a")
+
+    def fail_load_evaluation(path):
+        pytest.fail(f"warm cache should not decode {path}")
+
+    monkeypatch.setattr(data_module, "load_evaluation", fail_load_evaluation)
+    second = loader.load_statistics("small", ["model-a"], "stock-a")
+
+    assert second[0].top_k_accuracy == first[0].top_k_accuracy
+
+
+def test_benchmark_results_loader_computes_statistics_when_cache_is_unwritable(tmp_path, monkeypatch) -> None:
+    cache_file = tmp_path / "cache"
+    cache_file.write_text("not a directory", encoding="utf-8")
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(cache_file))
+    save_evaluation(
+        scored_evaluation(),
+        tmp_path / "retrocast" / "4-scored" / "small" / "model-a" / "stock-a" / "evaluation.json.gz",
+    )
+
+    stats = BenchmarkResultsLoader(tmp_path).load_statistics("small", ["model-a"], "stock-a")
+
+    assert len(stats) == 1
+    assert stats[0].top_k_accuracy[1].overall.value == 1.0
+
+
+def test_benchmark_results_loader_skips_unreadable_evaluations(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "retrocast" / "4-scored" / "small"
+    save_evaluation(scored_evaluation(), data_dir / "model-a" / "stock-a" / "evaluation.json.gz")
+    (data_dir / "model-b" / "stock-a" / "evaluation.json.gz").mkdir(parents=True)
+
+    stats = BenchmarkResultsLoader(tmp_path).load_statistics("small", ["model-a", "model-b"], "stock-a")
+
+    assert [model.model_name for model in stats] == ["model-a"]
+
+
 def test_missing_benchmark_raises_io_error(tmp_path) -> None:
     with pytest.raises(ArtifactNotFoundError):
         load_benchmark(tmp_path / "missing.json.gz")
@@ -344,3 +451,23 @@ def scored_evaluation(route_depth: int | Literal["short", "medium", "long"] = 1)
         cpu_time=0.5,
     )
     return Evaluation(task=task, tiers=[Tier.ZERO], targets={benchmark_target.id: target_result})
+
+
+def test_benchmark_results_loader_bootstraps_only_requested_top_k(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "retrocast"
+    evaluation_path = data_dir / "4-scored" / "small" / "model-a" / "stock-a" / "evaluation.json.gz"
+    save_evaluation(scored_evaluation(), evaluation_path)
+    extractor_names = []
+    compute_metrics_with_ci = data_module.compute_metrics_with_ci
+
+    def recording_compute(targets, extractors, **kwargs):
+        extractor_names.append(list(extractors))
+        return compute_metrics_with_ci(targets, extractors, **kwargs)
+
+    monkeypatch.setattr(data_module, "compute_metrics_with_ci", recording_compute)
+
+    stats = BenchmarkResultsLoader(tmp_path).load_statistics("small", ["model-a"], "stock-a", top_k=[10, 1, 10])
+
+    assert extractor_names == [["solv_0", "top_1", "top_10"]]
+    assert list(stats[0].top_k_accuracy) == [1, 10]
@@ -5,6 +5,7 @@ import numpy as np
 from retrocast.metrics.bootstrap import (
     check_reliability,
     compute_metric_with_ci,
+    compute_metrics_with_ci,
     get_bootstrap_distribution,
     summarize_values,
 )
@@ -66,6 +67,32 @@ def test_compute_metric_with_ci_groups_values() -> None:
     assert result.by_stratum["large"].value == 1.0
 
 
+def test_compute_metrics_with_ci_matches_per_metric_summaries() -> None:
+    values = list(range(40))
+    extractors = {
+        "even": lambda value: float(value % 2 == 0),
+        "small": lambda value: float(value < 7),
+    }
+
+    def stratify_by(value: int) -> str:
+        return "low" if value < 25 else "high"
+
+    results = compute_metrics_with_ci(values, extractors, stratify_by=stratify_by, n_boot=2500, seed=3)
+
+    assert list(results) == ["even", "small"]
+    for name, extractor in extractors.items():
+        assert results[name] == compute_metric_with_ci(
+            values, extractor, name, stratify_by=stratify_by, n_boot=2500, seed=3
+        )
+
+
+def test_compute_metrics_with_ci_handles_empty_targets() -> None:
+    results = compute_metrics_with_ci([], {"toy": float}, n_boot=10)
+
+    assert results["toy"].overall.count == 0
+    assert results["toy"].by_stratum == {}
+
+
 def test_get_bootstrap_distribution_shape_and_seed_stability() -> None:
     values = [1, 0, 1, 0]
 
@@ -74,3 +101,12 @@ def test_get_bootstrap_distribution_shape_and_seed_stability() -> None:
 
     assert left.shape == (100,)
     assert np.array_equal(left, right)
+
+
+def test_bootstrap_distribution_counts_binary_values_exactly_like_a_resampled_mean() -> None:
+    values = [1, 0, 0, 1, 1, 0, 1]
+    indices = np.random.default_rng(7).integers(0, len(values), (100, len(values)))
+
+    distribution = get_bootstrap_distribution(values, float, n_boot=100, seed=7)
+
+    assert np.array_equal(distribution, np.mean(np.array(values, dtype=np.float64)[indices], axis=1))
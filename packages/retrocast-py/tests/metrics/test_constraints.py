@@ -72,6 +72,16 @@ def test_stock_constraint_fails_when_leaf_is_missing() -> None:
     assert result.checks[0].code == "constraint.stock_termination.missing_leaf"
 
 
+def test_stock_constraint_accepts_frozen_stock_sets() -> None:
+    result = check_task_constraints(
+        route(),
+        [StockTerminationConstraint(stock="stock-a")],
+        [StockTerminationChecker(stocks={"stock-a": frozenset(stock_for("C", "CO"))})],
+    )
+
+    assert result.status == CheckStatus.PASS
+
+
 def test_stock_constraint_selects_stock_by_task_constraint_name() -> None:
     stocks = {
         "stock-a": stock_for("C"),
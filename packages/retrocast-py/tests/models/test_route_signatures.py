@@ -160,6 +160,20 @@ def test_route_leaves_and_depth_use_route_paths() -> None:
     assert route.depth() == 2
 
 
+@pytest.mark.unit
+def test_depth_takes_the_longest_branch_and_counts_empty_reactions() -> None:
+    short_branch = molecule("O", KEY_B, Reaction(reactants=[molecule("C", KEY_A)]))
+    long_branch = molecule(
+        "N", KEY_E, Reaction(reactants=[molecule("CC", KEY_D, Reaction(reactants=[molecule("C", KEY_A)]))])
+    )
+    route = Route(target=molecule("CO", KEY_C, Reaction(reactants=[short_branch, long_branch])))
+
+    assert route.depth() == 3
+    assert sorted(route.molecule_at(path).depth() for path in ("rc:m:/0", "rc:m:/1")) == [1, 2]
+    assert Route(target=molecule("C", KEY_A, Reaction(reactants=[]))).depth() == 1
+    assert Route(target=molecule("C", KEY_A, Reaction(reactants=[]))).topology() == (1, False)
+
+
 @pytest.mark.unit
 def test_find_molecules_returns_all_matching_route_nodes() -> None:
     route = one_step_route([molecule("C", KEY_A), molecule("C", KEY_A), molecule("O", KEY_B)])
@@ -573,3 +587,47 @@ def test_generated_duplicate_multiplicity_changes_signature(reactant_keys: list[
     with_extra_duplicate = one_step_route([molecule("C", key) for key in [*reactant_keys, reactant_keys[0]]])
 
     assert with_extra_duplicate.signature() != route.signature()
+
+
+@pytest.mark.unit
+def test_shared_reactant_instance_keys_like_distinct_copies() -> None:
+    def intermediate() -> Molecule:
+        return molecule("CO", KEY_B, product_of=Reaction(reactants=[molecule("C", KEY_A)]))
+
+    shared = intermediate()
+    with_shared = one_step_route([shared, shared])
+    with_copies = one_step_route([intermediate(), intermediate()])
+
+    assert with_shared.signature() == with_copies.signature()
+    assert with_shared.key(depth=1) == with_copies.key(depth=1)
+
+
+@pytest.mark.unit
+def test_shared_signature_cache_matches_uncached_signatures() -> None:
+    routes = [two_step_route(), one_step_route([molecule("C", KEY_A)]), two_step_route()]
+    cache: dict[tuple[object, ...], str] = {}
+
+    assert [route.signature(signature_cache=cache) for route in routes] == [route.signature() for route in routes]
+    assert [route.signature(depth=1, signature_cache=cache) for route in routes] == [
+        route.signature(depth=1) for route in routes
+    ]
+    assert routes[0].molecule_at("rc:m:/0").subtree_signature(signature_cache=cache) == (
+        routes[0].molecule_at("rc:m:/0").subtree_signature()
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_level", list(InChIKeyLevel))
+def test_subtree_key_embeds_the_reaction_view_key(match_level: InChIKeyLevel) -> None:
+    route = two_step_route()
+
+    assert route.key(match_level)[2] == route.reaction_at("rc:r:/").key(match_level)
+    assert route.molecule_at("rc:m:/0").subtree_key(match_level)[2] == route.reaction_at("rc:r:/0").key(match_level)
+
+
+@pytest.mark.unit
+@given(tree_shapes)
+def test_generated_route_topology_matches_depth_and_convergence(shape: TreeShape) -> None:
+    route = route_from_shape(shape)
+
+    assert route.topology() == (route.depth(), route.is_convergent())
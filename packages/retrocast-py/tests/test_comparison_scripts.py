@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import plotly.graph_objects as go
+import pytest
+
+from retrocast.io import save_evaluation
+from retrocast.io.data import MODEL_STATISTICS_TOP_K, statistics_top_k
+from tests.io.test_data import scored_evaluation
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts"
+
+
+def load_script(filename: str):
+    module_path = SCRIPTS_DIR / filename
+    spec = importlib.util.spec_from_file_location(module_path.stem.replace("-", "_"), module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"failed to load script module from {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("filename", "argv", "matrix_filename"),
+    [
+        (
+            "02-compare.py",
+            ["--benchmark", "small", "--models", "model-a", "--stock", "stock-a"],
+            "compare_matrix.html",
+        ),
+        (
+            "07-create-model-profile.py",
+            ["--model", "model-a", "--benchmarks", "small:stock-a"],
+            "difficulty_matrix.html",
+        ),
+    ],
+)
+def test_performance_matrix_keeps_default_top_k_columns(tmp_path, monkeypatch, filename, argv, matrix_filename) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path / "cache"))
+    data_dir = tmp_path / "data"
+    save_evaluation(scored_evaluation(), data_dir / "4-scored" / "small" / "model-a" / "stock-a" / "evaluation.json.gz")
+    script = load_script(filename)
+    monkeypatch.setattr(script, "DATA_DIR", data_dir)
+    figures: dict[str, go.Figure] = {}
+    monkeypatch.setattr(go.Figure, "write_html", lambda fig, path, **_: figures.setdefault(Path(path).name, fig))
+    monkeypatch.setattr(sys, "argv", [filename, *argv, "--top-k", "1", "5"])
+
+    script.main()
+
+    solvability, top_k = figures[matrix_filename].data
+    assert list(solvability.x) == ["Solvability"]
+    assert list(top_k.x) == [f"Top-{k}" for k in statistics_top_k([1, 5])]
+
+
+@pytest.mark.unit
+def test_statistics_top_k_keeps_every_default_and_adds_extra_k() -> None:
+    assert statistics_top_k([1, 5]) == list(MODEL_STATISTICS_TOP_K)
+    assert statistics_top_k([7, 100]) == sorted([*MODEL_STATISTICS_TOP_K, 7, 100])
@@ -0,0 +1,37 @@
+import hashlib
+import json
+
+import pytest
+
+from retrocast.hashing import HASH_CHUNK_SIZE, MMAP_MIN_SIZE, hash_file, hash_json
+
+
+@pytest.mark.parametrize("size", [0, 1, HASH_CHUNK_SIZE, 2 * HASH_CHUNK_SIZE + 17])
+def test_hash_file_matches_sha256_of_contents(tmp_path, size):
+    payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+    path = tmp_path / "payload.bin"
+    path.write_bytes(payload)
+
+    assert hash_file(path) == hashlib.sha256(payload).hexdigest()
+
+
+def test_hash_file_matches_sha256_above_and_below_mmap_threshold(tmp_path):
+    for size in (MMAP_MIN_SIZE - 1, MMAP_MIN_SIZE):
+        payload = bytes(index % 251 for index in range(size))
+        path = tmp_path / f"payload-{size}.bin"
+        path.write_bytes(payload)
+
+        assert hash_file(path) == hashlib.sha256(payload).hexdigest()
+
+
+def test_hash_json_matches_sha256_of_canonical_dumps():
+    values = [
+        {"b": [1, 2.5, None], "a": {"z": "é", "y": (True, False)}},
+        ("mol", "AAAAAAAAAAAAAA-UHFFFAOYSA-N", ("rxn", "x", ("y",)), ("0" * 64,)),
+        [float("nan"), float("inf"), -0.0],
+        "plain",
+    ]
+    for value in values:
+        payload = json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+        assert hash_json(value) == hashlib.sha256(payload.encode()).hexdigest()
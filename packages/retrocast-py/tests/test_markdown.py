@@ -49,3 +49,8 @@ def test_markdown_table_rejects_alignment_shape_mismatch() -> None:
 def test_markdown_table_rejects_row_shape_mismatch() -> None:
     with pytest.raises(ValueError, match="rows"):
         markdown_table(["name"], [("route", "extra")])
+
+
+@pytest.mark.unit
+def test_markdown_table_without_rows_keeps_header_and_separator() -> None:
+    assert markdown_table(["name", "count"], [], align=["left", "right"]) == "| name | count |\n| --- | ---: |"
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+from retrocast.utils.parallel import map_in_processes, map_in_threads, uses_process_pool
+
+_offset = 0
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def _set_offset(value: int) -> None:
+    global _offset
+    _offset = value
+
+
+def _add_offset(value: int) -> int:
+    return value + _offset
+
+
+@pytest.mark.unit
+def test_map_in_processes_runs_serially_by_default() -> None:
+    assert list(map_in_processes(_square, [1, 2, 3])) == [1, 4, 9]
+
+
+@pytest.mark.integration
+def test_map_in_processes_preserves_order_with_a_pool() -> None:
+    assert list(map_in_processes(_square, list(range(20)), max_workers=2)) == [value * value for value in range(20)]
+
+
+@pytest.mark.integration
+def test_map_in_processes_runs_initializer_in_each_pool_worker() -> None:
+    results = list(map_in_processes(_add_offset, [1, 2, 3, 4], max_workers=2, initializer=_set_offset, initargs=(10,)))
+
+    assert results == [11, 12, 13, 14]
+    assert _offset == 0
+
+
+@pytest.mark.unit
+def test_map_in_processes_never_runs_initializer_in_process() -> None:
+    results = list(map_in_processes(_add_offset, [1, 2], initializer=_set_offset, initargs=(10,)))
+
+    assert results == [1, 2]
+    assert _offset == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("max_workers", "item_count", "expected"),
+    [(None, 10, False), (1, 10, False), (2, 1, False), (2, 10, True)],
+)
+def test_uses_process_pool_matches_map_in_processes(max_workers: int | None, item_count: int, expected: bool) -> None:
+    assert uses_process_pool(max_workers, item_count) is expected
+
+
+@pytest.mark.unit
+def test_map_in_processes_rejects_non_positive_workers() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        list(map_in_processes(_square, [1], max_workers=0))
+
+
+@pytest.mark.unit
+def test_map_in_threads_preserves_order_with_a_pool() -> None:
+    assert list(map_in_threads(_square, list(range(20)), max_workers=4)) == [value * value for value in range(20)]
+
+
+@pytest.mark.unit
+def test_map_in_threads_rejects_non_positive_workers() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        list(map_in_threads(_square, [1], max_workers=0))
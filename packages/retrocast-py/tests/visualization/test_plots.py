@@ -55,6 +55,17 @@ def test_visualization_adapters_preserve_metric_values_and_error_bars() -> None:
     assert series[0].custom_data == [[40, 45.0, 55.00000000000001, "OK"], [40, 70.0, 80.0, "OK"]]
 
 
+@pytest.mark.unit
+def test_diagnostic_series_skip_metrics_without_depth_strata() -> None:
+    model_stats = stats("model-a")
+    model_stats.top_k_accuracy[5] = stratified_metric(0.8, {})
+
+    series = adapters.stats_to_diagnostic_series(model_stats)
+
+    assert [item.name for item in series] == ["Solvability", "Top-1"]
+    assert adapters.stats_to_diagnostic_series(SimpleNamespace(model_name="empty")) == []
+
+
 @pytest.mark.unit
 def test_visualization_adapters_support_overall_heatmap_and_stability_shapes() -> None:
     model_stats = [stats("model-a"), stats("model-b")]
@@ -103,6 +114,65 @@ def test_plot_functions_render_expected_trace_contracts() -> None:
     assert matrix_fig.data[1].x == ("Top-1", "Top-5", "Top-99")
 
 
+@pytest.mark.unit
+def test_diagnostic_plot_groups_bars_on_a_percentage_axis() -> None:
+    fig = plots.plot_diagnostics(stats("model-a"))
+
+    assert fig.layout.barmode == "group"
+    assert fig.layout.yaxis.range == (0, 100)
+    assert fig.layout.yaxis.title.text == "Percentage (%)"
+    assert fig.data[0].x == (1, 2)
+    assert fig.data[0].error_y.array == pytest.approx((5.0, 5.0))
+    assert fig.to_plotly_json()["data"][0]["error_y"]["array"]["dtype"] == "f8"
+
+
+@pytest.mark.integration
+def test_cached_diagnostic_plot_replays_the_rendered_figure(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path))
+    expected = plots.plot_diagnostics(stats("model-a"))
+
+    first = plots.plot_diagnostics(stats("model-a"), cache=True)
+    monkeypatch.setattr(plots, "_series_trace", lambda *_args, **_kwargs: pytest.fail("figure was rebuilt"))
+    replayed = plots.plot_diagnostics(stats("model-a"), cache=True)
+
+    assert first.to_plotly_json() == expected.to_plotly_json()
+    assert replayed.to_plotly_json() == expected.to_plotly_json()
+    assert len(list((tmp_path / "diagnostic-figures").iterdir())) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("target", "name", "value"),
+    [(plots.plotly, "__version__", "0.0.0-other"), (theme, "theme_fingerprint", lambda: "other-theme")],
+)
+def test_cached_diagnostic_plot_rerenders_when_plotly_or_theme_changes(
+    tmp_path, monkeypatch, target, name, value
+) -> None:
+    monkeypatch.setenv("RETROCAST_CACHE_DIR", str(tmp_path))
+    plots.plot_diagnostics(stats("model-a"), cache=True)
+    monkeypatch.setattr(target, name, value)
+    rebuilt = 0
+    series_trace = plots._series_trace
+
+    def counting_series_trace(*args, **kwargs):
+        nonlocal rebuilt
+        rebuilt += 1
+        return series_trace(*args, **kwargs)
+
+    monkeypatch.setattr(plots, "_series_trace", counting_series_trace)
+
+    plots.plot_diagnostics(stats("model-a"), cache=True)
+
+    assert rebuilt > 0
+    assert len(list((tmp_path / "diagnostic-figures").iterdir())) == 2
+
+
+@pytest.mark.unit
+def test_theme_fingerprint_is_a_stable_sha256() -> None:
+    assert theme.theme_fingerprint() == theme.theme_fingerprint()
+    assert len(theme.theme_fingerprint()) == 64
+
+
 @pytest.mark.unit
 def test_ranking_pairwise_stability_and_pareto_plots_encode_user_visible_values() -> None:
     ranking_fig = plots.plot_ranking(
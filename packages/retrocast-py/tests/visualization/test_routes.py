@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from retrocast.chem import get_inchi_key
 from retrocast.models.route import Molecule, Reaction, Route
 from retrocast.typing import SmilesStr
 from retrocast.visualization.depth import depth_group_sort_key, depth_group_value
-from retrocast.visualization.routes import extract_route_stats, is_convergent_route
+from retrocast.visualization.routes import (
+    RouteStats,
+    create_route_comparison_figure,
+    extract_route_stats,
+    is_convergent_route,
+    values_for_depths,
+)
 
 
 def molecule(smiles: str, product_of: Reaction | None = None) -> Molecule:
@@ -42,3 +50,48 @@ def test_convergent_route_requires_multiple_expanded_children_at_one_step() -> N
     route = Route(target=molecule("CCN", product_of=Reaction(reactants=[left, right, molecule("O")])))
 
     assert is_convergent_route(route)
+
+
+@pytest.mark.unit
+def test_values_for_depths_buckets_in_requested_order() -> None:
+    stats = [
+        RouteStats(depth=depth, target_hac=hac, target_mw=0.0, target_chiral=0, is_convergent=False)
+        for depth, hac in [(2, 5), (1, 3), (2, 7), (4, 9)]
+    ]
+
+    assert values_for_depths(stats, [3, 2, 1], "target_hac") == {3: [], 2: [5, 7], 1: [3]}
+    assert list(values_for_depths(stats, [3, 2, 1], "target_hac")) == [3, 2, 1]
+
+
+@pytest.mark.unit
+def test_route_comparison_violins_carry_depth_grouped_columns() -> None:
+    stats = [
+        RouteStats(depth=depth, target_hac=hac, target_mw=float(hac), target_chiral=1, is_convergent=False)
+        for depth, hac in [(3, 5), (2, 3), (3, 7)]
+    ]
+
+    fig = create_route_comparison_figure(stats, [])
+    violin = next(trace for trace in fig.data if trace.type == "violin")
+    serialized = next(trace for trace in json.loads(fig.to_json())["data"] if trace["type"] == "violin")
+
+    assert list(violin.x) == [2, 3, 3]
+    assert list(violin.y) == [3, 5, 7]
+    assert "bdata" in serialized["y"]
+
+
+@pytest.mark.unit
+def test_route_comparison_count_axes_fit_the_tallest_bar() -> None:
+    n1_stats = [
+        RouteStats(depth=depth, target_hac=1, target_mw=1.0, target_chiral=0, is_convergent=convergent)
+        for depth, convergent in [(2, True), (2, False), (3, True)]
+    ]
+    n5_stats = [
+        RouteStats(depth=3, target_hac=1, target_mw=1.0, target_chiral=0, is_convergent=False) for _ in range(4)
+    ]
+
+    fig = create_route_comparison_figure(n1_stats, n5_stats)
+
+    assert fig.layout.yaxis.range == pytest.approx((0, 4 * 1.15))
+    assert fig.layout.yaxis2.range == pytest.approx((0, 1 * 1.15))
+    assert [fig.layout[f"xaxis{suffix}"].range for suffix in ("", 2, 3, 4, 5)] == [(1.5, 10.5)] * 5
+    assert [fig.layout[f"xaxis{suffix}"].title.text for suffix in ("", 5)] == [None, "Route Length"]
@@ -93,3 +93,23 @@ def test_ingest_candidates_handles_target_smiles_keyed_payloads() -> None:
 def test_ingest_candidates_rejects_unkeyed_multi_target_payload() -> None:
     with pytest.raises(ValueError, match="Multi-target ingest"):
         ingest_candidates([{"smiles": "CCO"}], SmilesAdapter(), two_target_task())
+
+
+def test_ingest_candidates_with_process_pool_matches_serial_ingest() -> None:
+    raw_payload = {
+        "ethanol": [{"smiles": "CCO"}, {"smiles": "not-a-smiles"}],
+        "acetic-acid": [{"smiles": "CC(=O)O"}],
+    }
+    progress_calls = 0
+
+    def advance() -> None:
+        nonlocal progress_calls
+        progress_calls += 1
+
+    serial = ingest_candidates(raw_payload, SmilesAdapter(), two_target_task())
+    parallel = ingest_candidates(
+        raw_payload, SmilesAdapter(), two_target_task(), progress_callback=advance, max_workers=2
+    )
+
+    assert parallel == serial
+    assert progress_calls == 3
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from retrocast.chem import canonicalize_smiles, get_inchi_key
@@ -25,7 +28,7 @@ from retrocast.models import (
 from retrocast.typing import ErrorCode, InChIKeyStr, SmilesStr
 from retrocast.utils.timing import ExecutionStats
 from retrocast.workflow import AcceptableRouteMatch
-from retrocast.workflow.score import score, score_candidate
+from retrocast.workflow.score import acceptable_route_identities, score, score_candidate
 
 
 class FixedTierChecker:
@@ -384,3 +387,146 @@ def test_score_carries_execution_stats_to_target_results() -> None:
     target_result = evaluation.targets["ethanol"]
     assert target_result.wall_time == 12.5
     assert target_result.cpu_time == 3.25
+
+
+@pytest.mark.integration
+def test_score_with_process_pool_matches_serial_scoring() -> None:
+    acceptable = route()
+    benchmark_target = target([acceptable])
+    benchmark_task = Task(
+        name="small",
+        targets={
+            "ethanol": benchmark_target,
+            "ethanol-copy": benchmark_target.model_copy(update={"id": "ethanol-copy"}),
+        },
+        default_constraints=[StockTerminationConstraint(stock="stock"), RouteDepthConstraint(max_depth=2)],
+    )
+    predictions = {
+        "ethanol": [Candidate(rank=1, route=acceptable)],
+        "ethanol-copy": [Candidate(rank=1, route=route(reactant_smiles=("CC", "O")))],
+    }
+    checkers = [StockTerminationChecker(stocks={"stock": stock_for("C", "CO")}), RouteDepthChecker()]
+
+    serial = score(predictions, benchmark_task, constraint_checkers=checkers)
+    parallel = score(predictions, benchmark_task, constraint_checkers=checkers, max_workers=2)
+
+    assert parallel == serial
+    assert list(parallel.targets) == ["ethanol", "ethanol-copy"]
+
+
+class PickleCountingDepthChecker(RouteDepthChecker):
+    pickles = 0
+
+    def __reduce__(self) -> tuple[type[PickleCountingDepthChecker], tuple[()]]:
+        type(self).pickles += 1
+        return (type(self), ())
+
+
+@pytest.mark.integration
+def test_score_sends_checkers_to_each_worker_once() -> None:
+    acceptable = route()
+    benchmark_target = target([acceptable])
+    # 16 targets over 2 workers are mapped in 8 chunks; per-chunk pickling would send the checker 8 times.
+    target_ids = [f"ethanol-{index}" for index in range(16)]
+    benchmark_task = Task(
+        name="chunked",
+        targets={target_id: benchmark_target.model_copy(update={"id": target_id}) for target_id in target_ids},
+        default_constraints=[RouteDepthConstraint(max_depth=2)],
+    )
+    predictions = {target_id: [Candidate(rank=1, route=acceptable)] for target_id in target_ids}
+    PickleCountingDepthChecker.pickles = 0
+
+    parallel = score(predictions, benchmark_task, constraint_checkers=[PickleCountingDepthChecker()], max_workers=2)
+
+    assert PickleCountingDepthChecker.pickles <= 2
+    assert parallel == score(predictions, benchmark_task, constraint_checkers=[RouteDepthChecker()])
+
+
+class BarrierTierChecker(FixedTierChecker):
+    """Holds its first check until every concurrent scorer is mid-run, forcing the calls to interleave."""
+
+    def __init__(self, barrier: threading.Barrier, status: CheckStatus) -> None:
+        super().__init__(status)
+        self.barrier = barrier
+        self.waited = False
+
+    def check_route(self, route: Route) -> RouteValidity:
+        if not self.waited:
+            self.waited = True
+            self.barrier.wait(timeout=10)
+        return super().check_route(route)
+
+
+def test_concurrent_in_process_scores_keep_their_own_checkers() -> None:
+    acceptable = route()
+    benchmark_target = target([acceptable])
+    target_ids = [f"ethanol-{index}" for index in range(4)]
+    benchmark_task = Task(
+        name="concurrent",
+        targets={target_id: benchmark_target.model_copy(update={"id": target_id}) for target_id in target_ids},
+    )
+    predictions = {target_id: [Candidate(rank=1, route=acceptable)] for target_id in target_ids}
+    statuses = [CheckStatus.PASS, CheckStatus.FAIL] * 2
+    expected = [score(predictions, benchmark_task, tier_checkers=[FixedTierChecker(status)]) for status in statuses]
+    barrier = threading.Barrier(len(statuses))
+
+    with ThreadPoolExecutor(max_workers=len(statuses)) as pool:
+        results = list(
+            pool.map(
+                lambda status: score(predictions, benchmark_task, tier_checkers=[BarrierTierChecker(barrier, status)]),
+                statuses,
+            )
+        )
+
+    assert expected[0] != expected[1]
+    assert results == expected
+
+
+def test_score_reuses_precomputed_acceptable_route_identities() -> None:
+    acceptable = route()
+    benchmark_task = task(target([acceptable]))
+    identities = acceptable_route_identities(benchmark_task)
+    predictions = {"ethanol": [Candidate(rank=1, route=acceptable)]}
+
+    evaluation = score(predictions, benchmark_task, acceptable_identities=identities)
+
+    assert identities["ethanol"][0].signature == acceptable.signature()
+    assert evaluation == score(predictions, benchmark_task)
+    assert evaluation.targets["ethanol"].candidates[0].matched_acceptable_index == 0
+
+
+def fail_signature(*_args, **_kwargs) -> str:
+    raise AssertionError("route signature should not be computed")
+
+
+@pytest.mark.parametrize("route_match", [AcceptableRouteMatch.EXACT, AcceptableRouteMatch.PREFIX])
+def test_score_skips_route_signatures_without_acceptable_routes(monkeypatch, route_match) -> None:
+    monkeypatch.setattr(Route, "signature", fail_signature)
+
+    evaluation = score(
+        {"ethanol": [Candidate(rank=1, route=route())]},
+        task(target()),
+        acceptable_route_match=route_match,
+    )
+
+    assert not evaluation.targets["ethanol"].candidates[0].matches_acceptable
+
+
+def test_exact_match_skips_route_signature_when_no_reference_has_the_same_depth(monkeypatch) -> None:
+    deeper = Route(
+        target=molecule(
+            "CCO", product_of=Reaction(reactants=[molecule("CO", product_of=Reaction(reactants=[molecule("C")]))])
+        )
+    )
+    benchmark_task = task(target([deeper]))
+    identities = acceptable_route_identities(benchmark_task)
+    monkeypatch.setattr(Route, "signature", fail_signature)
+
+    evaluation = score(
+        {"ethanol": [Candidate(rank=1, route=route())]},
+        benchmark_task,
+        acceptable_route_match=AcceptableRouteMatch.EXACT,
+        acceptable_identities=identities,
+    )
+
+    assert not evaluation.targets["ethanol"].candidates[0].matches_acceptable
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import statistics
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from retrocast.chem import canonicalize_smiles, get_inchi_key
+from retrocast.models import (
+    CheckStatus,
+    ConstraintResult,
+    Evaluation,
+    FailureRecord,
+    Molecule,
+    Reaction,
+    Route,
+    RouteValidity,
+    ScoredCandidate,
+    Target,
+    TargetResult,
+    Task,
+    Tier,
+    TierResult,
+)
+from retrocast.typing import ErrorCode, InChIKeyStr, SmilesStr
+from retrocast.workflow.stats import CandidateRunStatistics, evaluation_statistics
+
+
+def molecule(smiles: str, *, product_of: Reaction | None = None) -> Molecule:
+    canonical = canonicalize_smiles(smiles)
+    return Molecule(
+        smiles=SmilesStr(canonical),
+        inchikey=InChIKeyStr(get_inchi_key(canonical)),
+        product_of=product_of,
+    )
+
+
+def target(target_id: str) -> Target:
+    canonical = canonicalize_smiles("CCO")
+    return Target(id=target_id, smiles=SmilesStr(canonical), inchikey=InChIKeyStr(get_inchi_key(canonical)))
+
+
+def candidate(rank: int, *, tier_one: CheckStatus) -> ScoredCandidate:
+    return ScoredCandidate(
+        rank=rank,
+        route=Route(target=molecule("CCO", product_of=Reaction(reactants=[molecule("C"), molecule("CO")]))),
+        validity=RouteValidity(
+            tiers={Tier.ZERO: TierResult(status=CheckStatus.PASS), Tier.ONE: TierResult(status=tier_one)}
+        ),
+        constraints=ConstraintResult(status=CheckStatus.PASS),
+    )
+
+
+def failed_candidate(rank: int) -> ScoredCandidate:
+    return ScoredCandidate(
+        rank=rank,
+        failure=FailureRecord(code=ErrorCode("adapter.schema_invalid"), target_id="a"),
+    )
+
+
+def test_evaluation_statistics_counts_candidates_timings_and_tiers_in_one_pass() -> None:
+    results = {
+        "a": TargetResult(
+            target=target("a"),
+            effective_constraints=[],
+            candidates=[failed_candidate(1), candidate(2, tier_one=CheckStatus.PASS)],
+            wall_time=1.5,
+            cpu_time=1.0,
+        ),
+        "b": TargetResult(
+            target=target("b"),
+            effective_constraints=[],
+            candidates=[candidate(1, tier_one=CheckStatus.FAIL)],
+            wall_time=0.5,
+        ),
+        "c": TargetResult(target=target("c"), effective_constraints=[]),
+    }
+    task = Task(name="small", targets={target_id: result.target for target_id, result in results.items()})
+
+    stats = evaluation_statistics(Evaluation(task=task, tiers=[Tier.ZERO, Tier.ONE], targets=results))
+
+    assert stats == {
+        "n_targets": 3,
+        "n_candidates": 3,
+        "n_failed_candidates": 1,
+        "total_wall_time_seconds": 2.0,
+        "mean_wall_time_seconds": 1.0,
+        "total_cpu_time_seconds": 1.0,
+        "mean_cpu_time_seconds": 1.0,
+        "n_solv_0": 2,
+        "n_solv_1": 1,
+    }
+    assert list(stats) == [
+        "n_targets",
+        "n_candidates",
+        "n_failed_candidates",
+        "total_wall_time_seconds",
+        "mean_wall_time_seconds",
+        "total_cpu_time_seconds",
+        "mean_cpu_time_seconds",
+        "n_solv_0",
+        "n_solv_1",
+    ]
+
+
+@given(st.lists(st.integers(min_value=1, max_value=10_000), max_size=50))
+def test_candidate_count_summary_matches_statistics_module(counts: list[int]) -> None:
+    stats = CandidateRunStatistics(
+        candidates_per_target={f"target-{index}": count for index, count in enumerate(counts)}
+    )
+
+    summary = stats.to_manifest_dict()
+
+    if not counts:
+        expected = [0, 0, 0.0, 0.0]
+    else:
+        expected = [
+            min(counts),
+            max(counts),
+            round(statistics.mean(counts), 2),
+            round(statistics.median(counts), 2),
+        ]
+    actual = [summary[f"{name}_candidates_per_target"] for name in ("min", "max", "avg", "median")]
+    assert actual == expected
+    assert [type(value) for value in actual] == [type(value) for value in expected]
@@ -406,6 +406,65 @@ class TestVerifyPhysicalIntegrity:
         pass_count = sum(1 for e in report.issues if e.level == "PASS" and "hash matches" in e.message.lower())
         assert pass_count == 2
 
+    def test_output_hash_takes_precedence_over_stale_source_hash(self, tmp_path):
+        """A file recorded as an output is checked against the output hash, whatever order manifests load in."""
+        data_file = tmp_path / "shared.txt"
+        data_file.write_text("current content")
+        producer = create_simple_manifest("produce", [data_file], root_dir=tmp_path)
+        data_file.write_text("stale content")
+        consumer = create_simple_manifest("consume", [], source_files=[data_file], root_dir=tmp_path)
+        data_file.write_text("current content")
+
+        from retrocast.models.provenance import VerificationReport
+
+        for graph in (
+            {Path("consumer.json"): consumer, Path("producer.json"): producer},
+            {Path("producer.json"): producer, Path("consumer.json"): consumer},
+        ):
+            report = VerificationReport(manifest_path=Path("consumer.json"))
+            _verify_physical_integrity(graph, tmp_path, report)
+            assert report.is_valid
+
+            output_only = VerificationReport(manifest_path=Path("consumer.json"))
+            _verify_physical_integrity(graph, tmp_path, output_only, output_only=True)
+            assert output_only.is_valid
+
+    def test_placeholder_hashes_fail_without_reading_the_file(self, tmp_path, monkeypatch):
+        """Recorded placeholders such as 'file-not-written' cannot match, so the file is not hashed."""
+        data_file = tmp_path / "output.txt"
+        data_file.write_text("written later")
+        manifest = create_simple_manifest("test", [data_file], root_dir=tmp_path)
+        manifest.output_files[0].file_hash = "file-not-written"
+
+        from retrocast.models.provenance import VerificationReport
+        from retrocast.workflow import verify as verify_module
+
+        monkeypatch.setattr(verify_module, "calculate_file_hash", lambda path: pytest.fail(f"hashed {path}"))
+        report = VerificationReport(manifest_path=Path("manifest.json"))
+        _verify_physical_integrity({Path("manifest.json"): manifest}, tmp_path, report)
+
+        assert not report.is_valid
+        assert any("HASH MISMATCH" in entry.message and entry.level == "FAIL" for entry in report.issues)
+
+    def test_shared_stat_cache_is_reused_across_phases(self, tmp_path):
+        """Existence answers recorded earlier in the run are not re-queried from disk."""
+        data_file = tmp_path / "output.txt"
+        data_file.write_text("content")
+        manifest = create_simple_manifest("test", [data_file], root_dir=tmp_path)
+
+        from retrocast.models.provenance import VerificationReport
+        from retrocast.workflow.verify import _StatCache
+
+        stats = _StatCache()
+        data_file.unlink()
+        assert not stats.exists(data_file)
+        data_file.write_text("content")
+
+        report = VerificationReport(manifest_path=Path("manifest.json"))
+        _verify_physical_integrity({Path("manifest.json"): manifest}, tmp_path, report, stats=stats)
+
+        assert any("MISSING" in entry.message and entry.level == "WARN" for entry in report.issues)
+
     def test_hash_mismatch_always_fails_regardless_of_lenient(self, tmp_path):
         """Hash mismatch should ALWAYS fail, even in lenient mode."""
         data_file = tmp_path / "output.txt"
@@ -533,6 +592,47 @@ class TestVerifyManifestShallow:
         assert report.is_valid  # Still valid in lenient mode
         assert any("MISSING" in e.message and e.level == "WARN" for e in report.issues)
 
+    def test_threaded_hashing_reports_the_same_issues_as_serial(self, tmp_path):
+        """Hashing files on a thread pool should not change the report."""
+        files = [tmp_path / f"output{index}.txt" for index in range(4)]
+        for index, data_file in enumerate(files):
+            data_file.write_text(f"data {index}")
+
+        manifest = create_simple_manifest("test", files, root_dir=tmp_path)
+        manifest_path = tmp_path / "manifest.json"
+        write_manifest_to_disk(manifest, manifest_path)
+        files[1].write_text("modified")
+        files[2].unlink()
+
+        serial = verify_manifest(manifest_path, tmp_path, deep=False)
+        threaded = verify_manifest(manifest_path, tmp_path, deep=False, max_workers=3)
+
+        assert threaded.issues == serial.issues
+        assert not threaded.is_valid
+
+    def test_shared_hash_cache_hashes_each_file_once(self, tmp_path, monkeypatch):
+        """Verifications sharing a hash cache reuse digests instead of re-reading files."""
+        data_file = tmp_path / "output.txt"
+        data_file.write_text("data")
+        manifest = create_simple_manifest("test", [data_file], root_dir=tmp_path)
+        manifest_path = tmp_path / "manifest.json"
+        write_manifest_to_disk(manifest, manifest_path)
+
+        from retrocast.workflow import verify as verify_module
+
+        hashed: list[Path] = []
+        original = verify_module.calculate_file_hash
+        monkeypatch.setattr(verify_module, "calculate_file_hash", lambda path: hashed.append(path) or original(path))
+
+        hash_cache: dict[Path, str] = {}
+        first = verify_manifest(manifest_path, tmp_path, deep=False, hash_cache=hash_cache)
+        second = verify_manifest(manifest_path, tmp_path, deep=False, hash_cache=hash_cache)
+
+        assert first.is_valid and second.is_valid
+        assert second.issues == first.issues
+        assert hashed == [tmp_path / "output.txt"]
+        assert hash_cache == {tmp_path / "output.txt": manifest.output_files[0].file_hash}
+
     def test_malformed_manifest_fails_gracefully(self, tmp_path):
         """Shallow verification should handle malformed manifest gracefully."""
         manifest_path = tmp_path / "manifest.json"
@@ -592,6 +692,45 @@ class TestVerifyManifestDeep:
         # Should have PASS for provenance graph build
         assert any("provenance graph with" in e.message.lower() and e.level == "PASS" for e in report.issues)
 
+    def test_threaded_graph_loading_reports_the_same_issues_as_serial(self, tmp_path):
+        """Loading each BFS level on threads should not change the report, including for shared parents."""
+        benchmark_file = tmp_path / "1-benchmarks" / "bench.json"
+        benchmark_file.parent.mkdir(parents=True)
+        benchmark_file.write_text("{}")
+
+        base_file = tmp_path / "3-processed" / "base" / "routes.json"
+        base_file.parent.mkdir(parents=True)
+        base_file.write_text("base")
+        write_manifest_to_disk(
+            create_simple_manifest("ingest", [base_file], [benchmark_file], root_dir=tmp_path),
+            base_file.parent / "manifest.json",
+        )
+
+        branch_files = []
+        for name in ("left", "right"):
+            branch_file = tmp_path / "4-scored" / name / "scores.json"
+            branch_file.parent.mkdir(parents=True)
+            branch_file.write_text(name)
+            write_manifest_to_disk(
+                create_simple_manifest("score", [branch_file], [base_file], root_dir=tmp_path),
+                branch_file.parent / "manifest.json",
+            )
+            branch_files.append(branch_file)
+
+        final_file = tmp_path / "5-results" / "summary.json"
+        final_file.parent.mkdir(parents=True)
+        final_file.write_text("summary")
+        final_manifest_path = final_file.parent / "manifest.json"
+        write_manifest_to_disk(
+            create_simple_manifest("analyze", [final_file], branch_files, root_dir=tmp_path), final_manifest_path
+        )
+
+        serial = verify_manifest(final_manifest_path, tmp_path, deep=True)
+        threaded = verify_manifest(final_manifest_path, tmp_path, deep=True, max_workers=4)
+
+        assert serial.is_valid
+        assert threaded.issues == serial.issues
+
     def test_three_level_chain_with_primary_artifact(self, tmp_path):
         """3-level chain ending in primary artifact should verify correctly."""
         # Primary: benchmark
@@ -763,6 +902,76 @@ class TestVerificationReport:
             assert isinstance(entry.message, str)
             assert len(entry.message) > 0
 
+    def test_extend_matches_repeated_add(self):
+        """A batch of issues should leave the report exactly as one add per issue would."""
+        from retrocast.models.provenance import VerificationIssue, VerificationReport
+
+        entries = [("PASS", Path("a.txt"), "ok"), ("FAIL", Path("b.txt"), "bad"), ("WARN", Path("c.txt"), "gone")]
+        added = VerificationReport(manifest_path=Path("manifest.json"))
+        for level, path, message in entries:
+            added.add(level, path, message, category="phase2")
+        extended = VerificationReport(manifest_path=Path("manifest.json"))
+        extended.extend(
+            VerificationIssue(level=level, path=path, message=message, category="phase2")
+            for level, path, message in entries
+        )
+
+        assert extended == added
+        assert not extended.is_valid
+
+    def test_include_info_false_drops_only_info_entries(self, tmp_path):
+        """Batch runs skip INFO entries but keep every other entry in order."""
+        data_file = tmp_path / "output.txt"
+        data_file.write_text("test")
+        manifest_path = tmp_path / "manifest.json"
+        write_manifest_to_disk(create_simple_manifest("test", [data_file], root_dir=tmp_path), manifest_path)
+
+        full = verify_manifest(manifest_path, tmp_path, deep=False)
+        quiet = verify_manifest(manifest_path, tmp_path, deep=False, include_info=False)
+
+        assert any(entry.level == "INFO" for entry in full.issues)
+        assert quiet.issues == [entry for entry in full.issues if entry.level != "INFO"]
+        assert set(quiet.model_dump()) == {"manifest_path", "is_valid", "issues"}
+
+    def test_include_info_false_never_builds_info_entries(self, tmp_path, monkeypatch):
+        """Batch runs skip INFO entries before formatting them, across every deep-verification phase."""
+        from retrocast.models.provenance import VerificationReport
+
+        primary_dir = tmp_path / "1-benchmarks"
+        primary_dir.mkdir()
+        primary_file = primary_dir / "benchmark.json"
+        primary_file.write_text("{}")
+        intermediate_dir = tmp_path / "3-processed"
+        intermediate_dir.mkdir()
+        intermediate_file = intermediate_dir / "routes.json"
+        intermediate_file.write_text("{}")
+        write_manifest_to_disk(
+            create_simple_manifest("ingest", [intermediate_file], [primary_file], root_dir=tmp_path),
+            intermediate_dir / "manifest.json",
+        )
+        final_dir = tmp_path / "4-scored"
+        final_dir.mkdir()
+        final_file = final_dir / "scores.json"
+        final_file.write_text("{}")
+        write_manifest_to_disk(
+            create_simple_manifest("score", [final_file], [intermediate_file], root_dir=tmp_path),
+            final_dir / "manifest.json",
+        )
+        levels: list[str] = []
+        add = VerificationReport.add
+
+        def recording_add(report, level, *args, **kwargs):
+            levels.append(level)
+            return add(report, level, *args, **kwargs)
+
+        monkeypatch.setattr(VerificationReport, "add", recording_add)
+
+        report = verify_manifest(final_dir / "manifest.json", tmp_path, deep=True, include_info=False)
+
+        assert report.is_valid
+        assert levels
+        assert "INFO" not in levels
+
     def test_is_valid_property_works_correctly(self, tmp_path):
         """is_valid should be True only when no FAIL entries exist."""
         # Valid case
@@ -21,7 +21,7 @@ from pathlib import Path
 
 from rich.progress import track
 
-from retrocast.io.data import BenchmarkResultsLoader
+from retrocast.io.data import BenchmarkResultsLoader, statistics_top_k
 from retrocast.utils.logging import configure_script_logging, logger
 from retrocast.visualization import plots
 
@@ -42,7 +42,10 @@ def main():
         nargs="+",
         type=int,
         default=[1, 2, 3, 4, 5, 10, 20, 50],
-        help="Top-K values to show in overall summary (default: 1, 2, 3, 4, 5, 10, 20, 50)",
+        help=(
+            "Top-K values to show in overall summary (default: 1, 2, 3, 4, 5, 10, 20, 50); "
+            "the performance matrix always shows the default K values"
+        ),
     )
     args = parser.parse_args()
 
@@ -52,7 +55,7 @@ def main():
     logger.info(f"Loading statistics for [bold cyan]{len(args.models)}[/] models...")
 
     # We use the loader to fetch valid stats objects
-    stats_list = loader.load_statistics(args.benchmark, args.models, args.stock)
+    stats_list = loader.load_statistics(args.benchmark, args.models, args.stock, top_k=statistics_top_k(args.top_k))
 
     if not stats_list:
         logger.error("[bold red]No valid statistics found. Exiting.[/]")
@@ -24,7 +24,7 @@ from pathlib import Path
 
 from rich.progress import track
 
-from retrocast.io.data import BenchmarkResultsLoader
+from retrocast.io.data import BenchmarkResultsLoader, statistics_top_k
 from retrocast.utils.logging import configure_script_logging, logger
 from retrocast.visualization import plots
 
@@ -61,7 +61,7 @@ def main():
         nargs="+",
         type=int,
         default=[1, 2, 3, 4, 5, 10, 20, 50],
-        help="Top-K values to show in overall summary",
+        help="Top-K values to show in overall summary; the performance matrix always shows the default K values",
     )
     args = parser.parse_args()
 
@@ -80,7 +80,9 @@ def main():
         try:
             # Load the specific model for this benchmark
             # Returns a list, but we only asked for one model
-            loaded_stats = loader.load_statistics(bench_name, [args.model], stock_name)
+            loaded_stats = loader.load_statistics(
+                bench_name, [args.model], stock_name, top_k=statistics_top_k(args.top_k)
+            )
 
             if not loaded_stats:
                 logger.warning(f"Model {args.model} not found for benchmark {bench_name}. Skipping.")
@@ -142,7 +142,7 @@ def main():
         model_list = list(HOURLY_COSTS.keys())
         logger.info(f"No models specified. Attempting to load all {len(model_list)} models with cost data...")
 
-    stats_list = loader.load_statistics(args.benchmark, model_list, args.stock)
+    stats_list = loader.load_statistics(args.benchmark, model_list, args.stock, top_k=[args.top_k])
 
     if not stats_list:
         logger.error("[bold red]No valid statistics found. Exiting.[/]")